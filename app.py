@@ -6,11 +6,17 @@ Slim app.py: Flask app, desk registry, unified tabbed dashboard.
 Each desk registers its own routes via desk.register_routes(app).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
 from datetime import datetime
+from string import Template
 from typing import Dict
+import orjson
 import pytz
 import os
+import threading
+import time as time_module
 
 from core.config import get_config
 from core.alerting import get_alert_status
@@ -18,7 +24,42 @@ from core.scheduler import start_scheduler
 from core.data.market_data import get_spx_snapshot, get_vix1d_snapshot, get_vix_snapshot, get_spx_aggregates
 from desks import ACTIVE_DESKS
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify() via orjson. Keeps Flask's sort_keys setting and its fallbacks for dates/Decimal/etc.
+
+    One visible difference from Flask's encoder: non-ASCII text (curly quotes,
+    emoji in headlines) is written as raw UTF-8 rather than \\uXXXX escapes,
+    i.e. the equivalent of ensure_ascii=False. The decoded JSON is the same.
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _encode(self, obj, indent=False):
+        option = self._OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        """jsonify() body straight from orjson's bytes (no str round-trip).
+
+        Mirrors DefaultJSONProvider.response() (argument handling via its
+        _prepare_response_obj, compact/debug indent rule, trailing newline);
+        tests/test_app.py pins this against Flask's own output.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._encode(obj, indent=indent) + b"\n", mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 ET_TZ = pytz.timezone('US/Eastern')
@@ -36,6 +77,331 @@ for desk in ACTIVE_DESKS:
 # SHARED ROUTES
 # ============================================================================
 
+# Page shell for the dashboard, parsed once at import. string.Template keeps the
+# CSS/JS braces literal; homepage() only fills in the $placeholders.
+_HOMEPAGE_TEMPLATE = Template("""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Ren's Trading Firm</title>
+        <style>
+            body {
+                font-family: 'Segoe UI', sans-serif;
+                max-width: 1100px;
+                margin: 40px auto;
+                padding: 20px;
+                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            }
+            .container {
+                background: white;
+                border-radius: 12px;
+                padding: 40px;
+                box-shadow: 0 15px 50px rgba(0,0,0,0.3);
+            }
+            .header {
+                border-bottom: 3px solid #2a5298;
+                padding-bottom: 20px;
+                margin-bottom: 30px;
+                display: flex;
+                justify-content: space-between;
+                align-items: center;
+            }
+            h1 {
+                color: #1e3c72;
+                margin: 0;
+                font-size: 28px;
+            }
+            .status {
+                display: inline-block;
+                padding: 8px 16px;
+                border-radius: 20px;
+                font-weight: bold;
+                color: white;
+                font-size: 13px;
+            }
+            .status-production { background: #10b981; }
+            .status-local { background: #d97706; border: 2px solid #b45309; }
+            .tab-bar {
+                display: flex;
+                gap: 4px;
+                margin-bottom: 24px;
+                border-bottom: 2px solid #e2e8f0;
+                padding-bottom: 0;
+            }
+            .tab-btn {
+                padding: 10px 20px;
+                border: none;
+                background: #f1f5f9;
+                color: #475569;
+                font-size: 14px;
+                font-weight: 600;
+                cursor: pointer;
+                border-radius: 8px 8px 0 0;
+                transition: all 0.2s;
+            }
+            .tab-btn:hover { background: #e2e8f0; }
+            .tab-btn.active {
+                background: #2a5298;
+                color: white;
+            }
+            .section {
+                margin: 20px 0;
+                padding: 16px 20px;
+                background: #f8fafc;
+                border-radius: 8px;
+                border-left: 4px solid #2a5298;
+            }
+            .section-title {
+                font-size: 16px;
+                font-weight: 700;
+                color: #1e3c72;
+                margin: 0 0 12px 0;
+            }
+            .info-item {
+                margin: 6px 0;
+                padding: 6px 10px;
+                background: white;
+                border-radius: 6px;
+                font-size: 14px;
+            }
+            .info-label {
+                font-weight: 600;
+                color: #475569;
+                display: inline-block;
+                min-width: 180px;
+            }
+            .info-value { color: #1e293b; }
+            .strategy-box {
+                background: #eff6ff;
+                border: 2px solid #3b82f6;
+                padding: 20px;
+                border-radius: 8px;
+                margin: 20px 0;
+            }
+            .strategy-title {
+                font-size: 18px;
+                font-weight: 700;
+                color: #1e40af;
+                margin: 0 0 12px 0;
+            }
+            .edge-item {
+                padding: 8px 0;
+                border-bottom: 1px solid #cbd5e1;
+            }
+            .edge-item:last-child { border-bottom: none; }
+            .edge-label { font-weight: 600; color: #1e40af; }
+            .edge-desc { color: #475569; margin-top: 4px; font-size: 14px; }
+            .endpoint {
+                background: #f3f4f6;
+                padding: 12px;
+                margin: 8px 0;
+                border-radius: 6px;
+                font-family: monospace;
+                font-size: 14px;
+            }
+            .endpoint a { color: #2a5298; text-decoration: none; font-weight: bold; }
+            .endpoint a:hover { text-decoration: underline; }
+            .desk-card {
+                background: #f8fafc;
+                border: 1px solid #e2e8f0;
+                border-radius: 8px;
+                padding: 20px;
+                margin: 12px 0;
+            }
+            .desk-card-title {
+                font-size: 16px;
+                font-weight: 700;
+                color: #1e3c72;
+                margin-bottom: 6px;
+            }
+            .desk-card-desc {
+                font-size: 13px;
+                color: #64748b;
+                margin-bottom: 10px;
+            }
+            .desk-card-stats {
+                display: flex;
+                gap: 24px;
+                font-size: 13px;
+                color: #334155;
+            }
+            .oa-badge {
+                display: inline-block;
+                background: #8b5cf6;
+                color: white;
+                padding: 4px 12px;
+                border-radius: 12px;
+                font-size: 11px;
+                font-weight: 700;
+                margin-bottom: 16px;
+            }
+            .oa-badge-inline {
+                background: #8b5cf6;
+                color: white;
+                padding: 2px 8px;
+                border-radius: 10px;
+                font-size: 10px;
+                font-weight: 600;
+                margin-left: 8px;
+                vertical-align: middle;
+            }
+            /* ── Compact group-tab styling (Desk N tabs) ───────────────── */
+            .group-header {
+                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+                color: white;
+                padding: 14px 18px;
+                border-radius: 8px;
+                margin-bottom: 14px;
+            }
+            .group-title {
+                font-size: 16px;
+                font-weight: 700;
+                margin-bottom: 4px;
+            }
+            .group-meta {
+                font-size: 12px;
+                color: #cbd5e1;
+            }
+            .bot-card {
+                background: white;
+                border: 1px solid #e2e8f0;
+                border-left: 3px solid #2a5298;
+                border-radius: 6px;
+                padding: 10px 14px;
+                margin: 8px 0;
+                font-size: 13px;
+            }
+            .bot-card-oa {
+                border-left-color: #8b5cf6;
+                background: #faf5ff;
+            }
+            /* Featured card: used for the only live bot in a group (Simple Condor in Desk 1). */
+            .bot-card-featured {
+                border-left-width: 5px;
+                box-shadow: 0 2px 8px rgba(16, 185, 129, 0.12);
+            }
+            .bot-card-featured .bot-name { color: #0f5132; }
+            .bot-card-header {
+                display: flex;
+                justify-content: space-between;
+                align-items: center;
+                margin-bottom: 6px;
+            }
+            .bot-name {
+                font-weight: 700;
+                color: #1e3c72;
+                font-size: 14px;
+            }
+            .bot-card-body {
+                color: #475569;
+            }
+            .bot-line {
+                margin: 3px 0;
+                line-height: 1.4;
+            }
+            .bot-line code {
+                background: #f1f5f9;
+                padding: 1px 6px;
+                border-radius: 4px;
+                font-size: 12px;
+                color: #1e293b;
+            }
+            .badge {
+                padding: 2px 8px;
+                border-radius: 10px;
+                font-size: 10px;
+                font-weight: 700;
+                color: white;
+                text-transform: uppercase;
+            }
+            .badge-live { background: #10b981; }
+            .badge-paper { background: #d97706; }
+            .badge-oa { background: #8b5cf6; }
+            .composition-tag {
+                font-size: 11px;
+                color: #64748b;
+                font-weight: 500;
+                margin-left: 8px;
+            }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>Ren's Trading Firm</h1>
+                <span class="$status_class">$status_text</span>
+                <div style="font-size: 13px; color: #64748b; margin-top: 8px; width: 100%;">All desks and strategies are under active development.</div>
+            </div>
+
+            <div class="tab-bar">
+                $tab_buttons
+            </div>
+
+            <div class="tab-content" id="tab-overview">
+                $desk_cards
+                <div class="section">
+                    <div class="section-title">System Information</div>
+                    <div class="info-item"><span class="info-label">Current Time:</span> <span class="info-value">$timestamp</span></div>
+                    <div class="info-item"><span class="info-label">Trading Windows:</span> <span class="info-value">$trading_windows</span></div>
+                    <div class="info-item"><span class="info-label">Environment:</span> <span class="info-value">$environment_label</span></div>
+                    <div class="info-item"><span class="info-label">Scheduler:</span> <span class="info-value">$poke_label</span></div>
+                </div>
+                <div class="section">
+                    <div class="section-title">Shared Endpoints</div>
+                    <div class="endpoint"><a href="/health">/health</a> - Health check (all desks)</div>
+                    <div class="endpoint"><a href="/test_polygon_delayed">/test_polygon_delayed</a> - Test Polygon data</div>
+                    <div class="endpoint"><a href="/test_slack">/test_slack</a> - Send test Slack alert</div>
+                </div>
+            </div>
+
+            $tab_contents
+        </div>
+
+        <script>
+        function switchTab(tabId) {
+            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
+            document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
+            document.getElementById('tab-' + tabId).style.display = 'block';
+            event.target.classList.add('active');
+        }
+        // Click-from-overview-card: switch to the matching tab and visually mark the tab button.
+        function switchTabFromCard(tabId) {
+            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
+            document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
+            const target = document.getElementById('tab-' + tabId);
+            if (target) target.style.display = 'block';
+            // Mark the corresponding tab button as active
+            document.querySelectorAll('.tab-btn').forEach(btn => {
+                if (btn.getAttribute('onclick') && btn.getAttribute('onclick').includes("'" + tabId + "'")) {
+                    btn.classList.add('active');
+                }
+            });
+        }
+        </script>
+    </body>
+    </html>
+    """)
+
+
+# Desk 1's OA-native bot card (static: not driven by this app)
+_DESK1_OA_NATIVE_CARD = """
+            <div class="bot-card bot-card-oa bot-card-featured">
+                <div class="bot-card-header">
+                    <span class="bot-name">Simple Condor (OA-native) — currently the only live bot</span>
+                    <span>
+                        <span class="badge badge-live">live</span>
+                        <span class="badge badge-oa">oa-native</span>
+                    </span>
+                </div>
+                <div class="bot-card-body">
+                    <div class="bot-line"><strong>Strategy:</strong> SPX iron condor, OA-managed end-to-end. No Python signal — OA's own scanner picks the entry; this app is not in the loop.</div>
+                    <div class="bot-line"><strong>Structure:</strong> <code>simple_IC_+_stop_loss_+_time_exit</code></div>
+                    <div class="bot-line"><strong>Role in the firm:</strong> production reference. Every python-signal bot below (Bot A control + B–F paper trial) is being measured against this baseline.</div>
+                </div>
+            </div>
+            """
+
+
 @app.route("/", methods=["GET"])
 def homepage():
     """Tabbed firm dashboard."""
@@ -69,7 +435,7 @@ def homepage():
         )
 
         # Build compact bot cards for this group
-        bot_cards_html = ""
+        bot_cards = []
         for desk in desks:
             health = desk.get_health()
             last_signal = health.get('last_signal') or '—'
@@ -81,7 +447,7 @@ def homepage():
                 'oa-native': 'badge-oa',
             }.get(getattr(desk, 'status_label', 'paper'), 'badge-paper')
             structure = getattr(desk, 'structure_label', '') or ''
-            bot_cards_html += f"""
+            bot_cards.append(f"""
             <div class="bot-card">
                 <div class="bot-card-header">
                     <span class="bot-name">{desk.display_name}</span>
@@ -94,28 +460,14 @@ def homepage():
                     <div class="bot-line"><a href="/{desk.desk_id}/trigger">/{desk.desk_id}/trigger</a></div>
                 </div>
             </div>
-            """
+            """)
+        bot_cards_html = "".join(bot_cards)
 
         # Group-specific OA-native add-ons. For Desk 1, this is the ONLY currently-live bot
         # in the group, so it renders at the TOP of the tab (above the paper python-signal bots).
         oa_native_extras = ""
         if group_id == "desk1_overnight_vrp":
-            oa_native_extras = """
-            <div class="bot-card bot-card-oa bot-card-featured">
-                <div class="bot-card-header">
-                    <span class="bot-name">Simple Condor (OA-native) — currently the only live bot</span>
-                    <span>
-                        <span class="badge badge-live">live</span>
-                        <span class="badge badge-oa">oa-native</span>
-                    </span>
-                </div>
-                <div class="bot-card-body">
-                    <div class="bot-line"><strong>Strategy:</strong> SPX iron condor, OA-managed end-to-end. No Python signal — OA's own scanner picks the entry; this app is not in the loop.</div>
-                    <div class="bot-line"><strong>Structure:</strong> <code>simple_IC_+_stop_loss_+_time_exit</code></div>
-                    <div class="bot-line"><strong>Role in the firm:</strong> production reference. Every python-signal bot below (Bot A control + B–F paper trial) is being measured against this baseline.</div>
-                </div>
-            </div>
-            """
+            oa_native_extras = _DESK1_OA_NATIVE_CARD
 
         tab_contents.append(f"""
         <div class="tab-content" id="tab-{group_id}" style="display:none;">
@@ -336,309 +688,17 @@ def homepage():
         for d in ACTIVE_DESKS
     )
 
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Ren's Trading Firm</title>
-        <style>
-            body {{
-                font-family: 'Segoe UI', sans-serif;
-                max-width: 1100px;
-                margin: 40px auto;
-                padding: 20px;
-                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            }}
-            .container {{
-                background: white;
-                border-radius: 12px;
-                padding: 40px;
-                box-shadow: 0 15px 50px rgba(0,0,0,0.3);
-            }}
-            .header {{
-                border-bottom: 3px solid #2a5298;
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            }}
-            h1 {{
-                color: #1e3c72;
-                margin: 0;
-                font-size: 28px;
-            }}
-            .status {{
-                display: inline-block;
-                padding: 8px 16px;
-                border-radius: 20px;
-                font-weight: bold;
-                color: white;
-                font-size: 13px;
-            }}
-            .status-production {{ background: #10b981; }}
-            .status-local {{ background: #d97706; border: 2px solid #b45309; }}
-            .tab-bar {{
-                display: flex;
-                gap: 4px;
-                margin-bottom: 24px;
-                border-bottom: 2px solid #e2e8f0;
-                padding-bottom: 0;
-            }}
-            .tab-btn {{
-                padding: 10px 20px;
-                border: none;
-                background: #f1f5f9;
-                color: #475569;
-                font-size: 14px;
-                font-weight: 600;
-                cursor: pointer;
-                border-radius: 8px 8px 0 0;
-                transition: all 0.2s;
-            }}
-            .tab-btn:hover {{ background: #e2e8f0; }}
-            .tab-btn.active {{
-                background: #2a5298;
-                color: white;
-            }}
-            .section {{
-                margin: 20px 0;
-                padding: 16px 20px;
-                background: #f8fafc;
-                border-radius: 8px;
-                border-left: 4px solid #2a5298;
-            }}
-            .section-title {{
-                font-size: 16px;
-                font-weight: 700;
-                color: #1e3c72;
-                margin: 0 0 12px 0;
-            }}
-            .info-item {{
-                margin: 6px 0;
-                padding: 6px 10px;
-                background: white;
-                border-radius: 6px;
-                font-size: 14px;
-            }}
-            .info-label {{
-                font-weight: 600;
-                color: #475569;
-                display: inline-block;
-                min-width: 180px;
-            }}
-            .info-value {{ color: #1e293b; }}
-            .strategy-box {{
-                background: #eff6ff;
-                border: 2px solid #3b82f6;
-                padding: 20px;
-                border-radius: 8px;
-                margin: 20px 0;
-            }}
-            .strategy-title {{
-                font-size: 18px;
-                font-weight: 700;
-                color: #1e40af;
-                margin: 0 0 12px 0;
-            }}
-            .edge-item {{
-                padding: 8px 0;
-                border-bottom: 1px solid #cbd5e1;
-            }}
-            .edge-item:last-child {{ border-bottom: none; }}
-            .edge-label {{ font-weight: 600; color: #1e40af; }}
-            .edge-desc {{ color: #475569; margin-top: 4px; font-size: 14px; }}
-            .endpoint {{
-                background: #f3f4f6;
-                padding: 12px;
-                margin: 8px 0;
-                border-radius: 6px;
-                font-family: monospace;
-                font-size: 14px;
-            }}
-            .endpoint a {{ color: #2a5298; text-decoration: none; font-weight: bold; }}
-            .endpoint a:hover {{ text-decoration: underline; }}
-            .desk-card {{
-                background: #f8fafc;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 12px 0;
-            }}
-            .desk-card-title {{
-                font-size: 16px;
-                font-weight: 700;
-                color: #1e3c72;
-                margin-bottom: 6px;
-            }}
-            .desk-card-desc {{
-                font-size: 13px;
-                color: #64748b;
-                margin-bottom: 10px;
-            }}
-            .desk-card-stats {{
-                display: flex;
-                gap: 24px;
-                font-size: 13px;
-                color: #334155;
-            }}
-            .oa-badge {{
-                display: inline-block;
-                background: #8b5cf6;
-                color: white;
-                padding: 4px 12px;
-                border-radius: 12px;
-                font-size: 11px;
-                font-weight: 700;
-                margin-bottom: 16px;
-            }}
-            .oa-badge-inline {{
-                background: #8b5cf6;
-                color: white;
-                padding: 2px 8px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: 600;
-                margin-left: 8px;
-                vertical-align: middle;
-            }}
-            /* ── Compact group-tab styling (Desk N tabs) ───────────────── */
-            .group-header {{
-                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-                color: white;
-                padding: 14px 18px;
-                border-radius: 8px;
-                margin-bottom: 14px;
-            }}
-            .group-title {{
-                font-size: 16px;
-                font-weight: 700;
-                margin-bottom: 4px;
-            }}
-            .group-meta {{
-                font-size: 12px;
-                color: #cbd5e1;
-            }}
-            .bot-card {{
-                background: white;
-                border: 1px solid #e2e8f0;
-                border-left: 3px solid #2a5298;
-                border-radius: 6px;
-                padding: 10px 14px;
-                margin: 8px 0;
-                font-size: 13px;
-            }}
-            .bot-card-oa {{
-                border-left-color: #8b5cf6;
-                background: #faf5ff;
-            }}
-            /* Featured card: used for the only live bot in a group (Simple Condor in Desk 1). */
-            .bot-card-featured {{
-                border-left-width: 5px;
-                box-shadow: 0 2px 8px rgba(16, 185, 129, 0.12);
-            }}
-            .bot-card-featured .bot-name {{ color: #0f5132; }}
-            .bot-card-header {{
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                margin-bottom: 6px;
-            }}
-            .bot-name {{
-                font-weight: 700;
-                color: #1e3c72;
-                font-size: 14px;
-            }}
-            .bot-card-body {{
-                color: #475569;
-            }}
-            .bot-line {{
-                margin: 3px 0;
-                line-height: 1.4;
-            }}
-            .bot-line code {{
-                background: #f1f5f9;
-                padding: 1px 6px;
-                border-radius: 4px;
-                font-size: 12px;
-                color: #1e293b;
-            }}
-            .badge {{
-                padding: 2px 8px;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: 700;
-                color: white;
-                text-transform: uppercase;
-            }}
-            .badge-live {{ background: #10b981; }}
-            .badge-paper {{ background: #d97706; }}
-            .badge-oa {{ background: #8b5cf6; }}
-            .composition-tag {{
-                font-size: 11px;
-                color: #64748b;
-                font-weight: 500;
-                margin-left: 8px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>Ren's Trading Firm</h1>
-                <span class="{status_class}">{status_text}</span>
-                <div style="font-size: 13px; color: #64748b; margin-top: 8px; width: 100%;">All desks and strategies are under active development.</div>
-            </div>
-
-            <div class="tab-bar">
-                {''.join(tab_buttons)}
-            </div>
-
-            <div class="tab-content" id="tab-overview">
-                {desk_cards}
-                <div class="section">
-                    <div class="section-title">System Information</div>
-                    <div class="info-item"><span class="info-label">Current Time:</span> <span class="info-value">{timestamp}</span></div>
-                    <div class="info-item"><span class="info-label">Trading Windows:</span> <span class="info-value">{trading_windows}</span></div>
-                    <div class="info-item"><span class="info-label">Environment:</span> <span class="info-value">{ENVIRONMENT_LABEL}</span></div>
-                    <div class="info-item"><span class="info-label">Scheduler:</span> <span class="info-value">{poke_label}</span></div>
-                </div>
-                <div class="section">
-                    <div class="section-title">Shared Endpoints</div>
-                    <div class="endpoint"><a href="/health">/health</a> - Health check (all desks)</div>
-                    <div class="endpoint"><a href="/test_polygon_delayed">/test_polygon_delayed</a> - Test Polygon data</div>
-                    <div class="endpoint"><a href="/test_slack">/test_slack</a> - Send test Slack alert</div>
-                </div>
-            </div>
-
-            {''.join(tab_contents)}
-        </div>
-
-        <script>
-        function switchTab(tabId) {{
-            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
-            document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
-            document.getElementById('tab-' + tabId).style.display = 'block';
-            event.target.classList.add('active');
-        }}
-        // Click-from-overview-card: switch to the matching tab and visually mark the tab button.
-        function switchTabFromCard(tabId) {{
-            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
-            document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
-            const target = document.getElementById('tab-' + tabId);
-            if (target) target.style.display = 'block';
-            // Mark the corresponding tab button as active
-            document.querySelectorAll('.tab-btn').forEach(btn => {{
-                if (btn.getAttribute('onclick') && btn.getAttribute('onclick').includes("'" + tabId + "'")) {{
-                    btn.classList.add('active');
-                }}
-            }});
-        }}
-        </script>
-    </body>
-    </html>
-    """
-    return html
+    return _HOMEPAGE_TEMPLATE.substitute(
+        status_class=status_class,
+        status_text=status_text,
+        tab_buttons=''.join(tab_buttons),
+        desk_cards=desk_cards,
+        timestamp=timestamp,
+        trading_windows=trading_windows,
+        environment_label=ENVIRONMENT_LABEL,
+        poke_label=poke_label,
+        tab_contents=''.join(tab_contents),
+    )
 
 
 @app.route("/health", methods=["GET"])
@@ -654,9 +714,58 @@ def health_check():
     }), 200
 
 
+# (result key, fetcher) for each snapshot reported by /test_polygon_delayed.
+# A probe run checks live connectivity, so it calls the uncached fetchers
+# (__wrapped__) rather than the 60 s TTL-cached ones the desks use; the SPX
+# aggregates below are probed the same way.
+_POLYGON_SNAPSHOT_PROBES = (
+    ('spx_snapshot', get_spx_snapshot.__wrapped__),
+    ('vix1d_snapshot', get_vix1d_snapshot.__wrapped__),
+    ('vix_snapshot', get_vix_snapshot.__wrapped__),
+)
+
+# Repeat curl probes within this window are answered from the last READY probe
+# run instead of spending four more Polygon calls. A PARTIAL run is not kept,
+# so a failing probe is re-run live on the next request. The lock makes
+# probes that arrive together share one run.
+POLYGON_PROBE_TTL_SECONDS = 60
+_polygon_probe_cache = (None, None)  # (monotonic fetched_at, probe sections)
+_polygon_probe_lock = threading.Lock()
+
+
+def _run_polygon_probes():
+    """Call Polygon once per probe. Returns the probe sections plus overall 'status'."""
+    # The four Polygon calls are independent: fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(_POLYGON_SNAPSHOT_PROBES) + 1) as pool:
+        snapshot_futures = {key: pool.submit(fetch) for key, fetch in _POLYGON_SNAPSHOT_PROBES}
+        agg_future = pool.submit(get_spx_aggregates.__wrapped__)
+
+    probes = {}
+    for key, future in snapshot_futures.items():
+        snapshot = future.result()
+        probes[key] = {
+            'status': 'SUCCESS' if snapshot else 'FAILED',
+            'data': snapshot
+        }
+
+    spx_agg = agg_future.result()
+    probes['spx_aggregates'] = {
+        'status': 'SUCCESS' if spx_agg else 'FAILED',
+        'days_returned': len(spx_agg['closes']) if spx_agg else 0,
+        'sample_closes': spx_agg['closes'][:5] if spx_agg else []
+    }
+
+    if probes['spx_snapshot']['data'] and probes['vix1d_snapshot']['data'] and spx_agg:
+        probes['status'] = 'READY'
+    else:
+        probes['status'] = 'PARTIAL'
+    return probes
+
+
 @app.route("/test_polygon_delayed", methods=["GET"])
 def test_polygon_delayed():
     """Test Polygon Indices Starter - SPX and VIX1D (15-min delayed)"""
+    global _polygon_probe_cache
     results = {
         'test_time': datetime.now(ET_TZ).strftime('%Y-%m-%d %I:%M:%S %p %Z'),
         'plan': 'Indices Starter ($49/mo) - 15-min delayed',
@@ -665,36 +774,19 @@ def test_polygon_delayed():
     if not POLYGON_API_KEY:
         return jsonify({'error': 'No API key'}), 500
 
-    spx_snapshot = get_spx_snapshot()
-    results['spx_snapshot'] = {
-        'status': 'SUCCESS' if spx_snapshot else 'FAILED',
-        'data': spx_snapshot
-    }
-
-    vix1d_snapshot = get_vix1d_snapshot()
-    results['vix1d_snapshot'] = {
-        'status': 'SUCCESS' if vix1d_snapshot else 'FAILED',
-        'data': vix1d_snapshot
-    }
-
-    vix_snapshot = get_vix_snapshot()
-    results['vix_snapshot'] = {
-        'status': 'SUCCESS' if vix_snapshot else 'FAILED',
-        'data': vix_snapshot
-    }
-
-    spx_agg = get_spx_aggregates()
-    results['spx_aggregates'] = {
-        'status': 'SUCCESS' if spx_agg else 'FAILED',
-        'days_returned': len(spx_agg['closes']) if spx_agg else 0,
-        'sample_closes': spx_agg['closes'][:5] if spx_agg else []
-    }
-
-    if spx_snapshot and vix1d_snapshot and spx_agg:
-        results['status'] = 'READY'
-    else:
-        results['status'] = 'PARTIAL'
-
+    with _polygon_probe_lock:
+        fetched_at, probes = _polygon_probe_cache
+        age = time_module.monotonic() - fetched_at if probes else None
+        cached = age is not None and age < POLYGON_PROBE_TTL_SECONDS
+        if not cached:
+            probes = _run_polygon_probes()
+            age = 0.0
+            if probes['status'] == 'READY':
+                _polygon_probe_cache = (time_module.monotonic(), probes)
+
+    results['cached'] = cached
+    results['probe_age_seconds'] = round(age, 1)
+    results.update(probes)
     return jsonify(results), 200
 
 
@@ -711,6 +803,7 @@ def test_slack():
         "This is a test alert from Ren's Trading Firm. "
         "If you see this in Slack, alerting is working correctly!",
         level='info',
+        flush=True,
     )
 
     if success:
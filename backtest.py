@@ -25,10 +25,10 @@ import time as time_module
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
-import requests
 import pytz
 
 from core.config import get_config
+from core.http import SESSION, json_body
 from desks.overnight_condors.signals.iv_rv_ratio import analyze_iv_rv_ratio
 from desks.overnight_condors.signals.market_trend import analyze_market_trend
 from desks.overnight_condors.signal_engine import calculate_composite_score, generate_signal, detect_contradictions
@@ -52,9 +52,9 @@ def _fetch_historical_bars(ticker: str, start: str, end: str, api_key: str) -> O
     )
     for attempt in range(3):
         try:
-            resp = requests.get(url, timeout=20)
+            resp = SESSION.get(url, timeout=20)
             if resp.status_code == 200:
-                data = resp.json()
+                data = json_body(resp)
                 return data.get('results', [])
             if resp.status_code == 429:
                 time_module.sleep(2 ** attempt)
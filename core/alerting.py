@@ -10,11 +10,15 @@ Configure ALERT_WEBHOOK_URL in .config [WEBHOOKS] section or as an env var.
 
 Multi-desk aware: alert functions accept an optional desk_id for per-desk tracking.
 """
-import requests
+import atexit
+import queue
 import threading
+import time as time_module
 from datetime import datetime, time as dt_time
 import pytz
 
+from core.http import post_json
+
 ET_TZ = pytz.timezone('US/Eastern')
 TRADING_WINDOW_START = dt_time(hour=13, minute=30)
 TRADING_WINDOW_END = dt_time(hour=14, minute=30)
@@ -27,25 +31,163 @@ _state = {
     'last_poke_time': None,         # Datetime of last poke attempt
     'consecutive_api_failures': 0,  # Count of consecutive API errors
     'api_failure_source': None,     # Which API is failing
-    'alerts_sent_today': set(),     # Avoid spamming same alert type
+    'alerts_sent_date': None,       # ET date the dedup set below belongs to
+    'alerts_sent_today': set(),     # Avoid spamming same alert type (today's keys only)
 }
 
 _lock = threading.Lock()
 
+# (date, 'YYYY-MM-DD') for the last date formatted by _date_str. A single
+# tuple is swapped atomically, so readers never see a mismatched pair.
+_date_str_cache = (None, None)
+
+# Non-critical alerts are queued and coalesced into one Slack message per batch
+# window, so a burst of warnings costs one webhook round-trip instead of many.
+ALERT_BATCH_WINDOW_SEC = 0.5
+ALERT_BATCH_MAX = 20
+
+_alert_queue = queue.Queue()
+_alert_worker = None
+_alert_worker_lock = threading.Lock()
+
+# Queued alerts live only in the daemon worker, so at exit the worker is told
+# to post whatever it holds and is given this long to finish.
+ALERT_DRAIN_TIMEOUT_SEC = 10
+_ALERT_STOP = object()
+
+
+# Only a successfully resolved URL is cached: a failed or empty config read is
+# retried on the next alert so one bad read can't silence alerting for good.
+_webhook_url = None
+
 
 def _get_webhook_url():
-    """Get alert webhook URL from config. Returns None if not configured."""
+    """Get alert webhook URL from config. Returns None if not configured.
+
+    Cached once resolved; call reset_webhook_cache() after changing config.
+    """
+    global _webhook_url
+    if _webhook_url:
+        return _webhook_url
     try:
         from core.config import get_config
         config = get_config()
         url = (config.get('ALERT_WEBHOOK_URL') or '').strip()
-        return url if url else None
     except Exception:
         return None
+    if url:
+        _webhook_url = url
+    return url or None
+
+
+def reset_webhook_cache():
+    """Forget the cached webhook URL so the next alert re-reads config."""
+    global _webhook_url
+    _webhook_url = None
+
 
+def _date_str(now):
+    """Return now's date as 'YYYY-MM-DD', reformatting only when the day changes."""
+    global _date_str_cache
+    day = now.date()
+    cached_day, cached_str = _date_str_cache
+    if cached_day != day:
+        cached_str = day.isoformat()
+        _date_str_cache = (day, cached_str)
+    return cached_str
 
-def _send_alert(title, message, level='warning', desk_id=None):
-    """Send an alert via webhook. Supports Slack incoming webhook format."""
+
+def _post_alert_text(url, text, label, desk_tag=""):
+    """POST one Slack message. Returns True on HTTP 200.
+
+    A single alert logs as "[ALERT] [desk] ... title"; a batch passes its
+    joined "title [desk]" labels with no desk_tag.
+    """
+    try:
+        resp = post_json(url, {'text': text}, timeout=10)
+        if resp.status_code == 200:
+            print(f"  [ALERT]{desk_tag} Sent: {label}")
+            return True
+        else:
+            print(f"  [ALERT]{desk_tag} Webhook returned {resp.status_code} for: {label}")
+            return False
+    except Exception as e:
+        print(f"  [ALERT]{desk_tag} Failed to send {label}: {e}")
+        return False
+
+
+def _collect_alert_batch():
+    """Block for the next alert, then gather what arrives within one batch window.
+
+    Returns (batch, stop). Once the exit sentinel is seen the window is cut
+    short, everything still queued is taken at once and stop is True.
+    """
+    batch = []
+    item = _alert_queue.get()
+    deadline = time_module.monotonic() + ALERT_BATCH_WINDOW_SEC
+    while item is not _ALERT_STOP:
+        batch.append(item)
+        remaining = deadline - time_module.monotonic()
+        if len(batch) >= ALERT_BATCH_MAX or remaining <= 0:
+            return batch, False
+        try:
+            item = _alert_queue.get(timeout=remaining)
+        except queue.Empty:
+            return batch, False
+    while True:
+        try:
+            batch.append(_alert_queue.get_nowait())
+        except queue.Empty:
+            return batch, True
+
+
+def _post_alert_batch(batch):
+    """POST queued alerts, one Slack message per webhook URL."""
+    # Each item carries the webhook URL resolved when it was queued, so a
+    # batch is never dropped by a config read failing later on.
+    by_url = {}
+    for url, item_text, item_label in batch:
+        by_url.setdefault(url, []).append((item_text, item_label))
+    for url, items in by_url.items():
+        text = "\n\n".join(item_text for item_text, _ in items)
+        label = "; ".join(item_label for _, item_label in items)
+        _post_alert_text(url, text, label)
+
+
+def _alert_worker_loop():
+    """Post queued alerts in batches until the exit sentinel arrives."""
+    while True:
+        batch, stop = _collect_alert_batch()
+        _post_alert_batch(batch)
+        if stop:
+            return
+
+
+def _ensure_alert_worker():
+    global _alert_worker
+    with _alert_worker_lock:
+        if _alert_worker is None or not _alert_worker.is_alive():
+            _alert_worker = threading.Thread(target=_alert_worker_loop, daemon=True)
+            _alert_worker.start()
+
+
+@atexit.register
+def _drain_alert_queue():
+    """Post alerts still waiting in the batch queue before the process exits."""
+    worker = _alert_worker
+    if worker is None or not worker.is_alive():
+        return
+    _alert_queue.put(_ALERT_STOP)
+    worker.join(timeout=ALERT_DRAIN_TIMEOUT_SEC)
+
+
+def _send_alert(title, message, level='warning', desk_id=None, flush=False):
+    """Send an alert via webhook. Supports Slack incoming webhook format.
+
+    Critical alerts (or flush=True) are posted immediately and the return value
+    reflects delivery. Other alerts are queued and sent in batches by a
+    background thread; the return value then only means "queued".
+    """
     url = _get_webhook_url()
     desk_tag = f" [{desk_id}]" if desk_id else ""
     if not url:
@@ -57,28 +199,20 @@ def _send_alert(title, message, level='warning', desk_id=None):
 
     icon = {'info': 'information_source', 'warning': 'warning', 'critical': 'rotating_light'}.get(level, 'warning')
 
-    payload = {
-        'text': f":{icon}: *SPX Vol Signal{desk_tag} — {title}*\n{message}\n_{timestamp}_"
-    }
+    text = f":{icon}: *SPX Vol Signal{desk_tag} — {title}*\n{message}\n_{timestamp}_"
+    if flush or level == 'critical':
+        return _post_alert_text(url, text, title, desk_tag)
 
-    try:
-        resp = requests.post(url, json=payload, timeout=10)
-        if resp.status_code == 200:
-            print(f"  [ALERT]{desk_tag} Sent: {title}")
-            return True
-        else:
-            print(f"  [ALERT]{desk_tag} Webhook returned {resp.status_code}")
-            return False
-    except Exception as e:
-        print(f"  [ALERT]{desk_tag} Failed to send: {e}")
-        return False
+    _ensure_alert_worker()
+    _alert_queue.put((url, text, f"{title}{desk_tag}"))
+    return True
 
 
 def record_signal_success(desk_id=None):
     """Call this after a successful signal generation."""
     with _lock:
         now = datetime.now(ET_TZ)
-        _state['last_signal_date'] = now.strftime('%Y-%m-%d')
+        _state['last_signal_date'] = _date_str(now)
         _state['last_signal_time'] = now
         _state['consecutive_api_failures'] = 0
         _state['api_failure_source'] = None
@@ -97,21 +231,46 @@ def record_api_failure(source, desk_id=None):
             _state['consecutive_api_failures'] = 1
 
         count = _state['consecutive_api_failures']
+        if count < 2:
+            return
 
-    if count >= 2:
-        today = datetime.now(ET_TZ).strftime('%Y-%m-%d')
-        alert_key = f"api_failure_{source}_{today}"
-        with _lock:
-            if alert_key in _state['alerts_sent_today']:
-                return
-            _state['alerts_sent_today'].add(alert_key)
+        today = _date_str(datetime.now(ET_TZ))
+        if not _claim_alert_locked(f"api_failure_{source}_{today}", today):
+            return
 
-        _send_alert(
-            f"{source} API Down",
-            f"{source} has failed {count} consecutive times. Signal quality may be degraded.",
-            level='critical',
-            desk_id=desk_id,
-        )
+    _send_alert(
+        f"{source} API Down",
+        f"{source} has failed {count} consecutive times. Signal quality may be degraded.",
+        level='critical',
+        desk_id=desk_id,
+    )
+
+
+def _claim_alert_locked(alert_key, today):
+    """Mark alert_key as sent; caller holds _lock. Returns False if already sent.
+
+    The dedup set only ever holds one ET day's keys: it is replaced as soon as
+    the date rolls over, so it stays bounded even if reset_daily() never runs.
+    """
+    if _state['alerts_sent_date'] != today:
+        _state['alerts_sent_date'] = today
+        _state['alerts_sent_today'] = set()
+    if alert_key in _state['alerts_sent_today']:
+        return False
+    _state['alerts_sent_today'].add(alert_key)
+    return True
+
+
+def _claim_alert(alert_key, today):
+    """Mark alert_key as sent. Returns False if it was already sent today.
+
+    The unlocked membership test is the steady-state fast path (set reads are
+    atomic under the GIL); the lock is only taken to re-check and add.
+    """
+    if alert_key in _state['alerts_sent_today']:
+        return False
+    with _lock:
+        return _claim_alert_locked(alert_key, today)
 
 
 def record_poke():
@@ -126,20 +285,16 @@ def check_end_of_window():
     Should be called around 2:30-2:35 PM ET (e.g. from poke thread).
     """
     now = datetime.now(ET_TZ)
-    today = now.strftime('%Y-%m-%d')
+    today = _date_str(now)
 
     # Only check on weekdays
     if now.weekday() >= 5:
         return
 
-    with _lock:
-        last_date = _state['last_signal_date']
-        alert_key = f"no_signal_{today}"
-        already_sent = alert_key in _state['alerts_sent_today']
+    if _state['last_signal_date'] == today:
+        return
 
-    if last_date != today and not already_sent:
-        with _lock:
-            _state['alerts_sent_today'].add(alert_key)
+    if _claim_alert(f"no_signal_{today}", today):
         _send_alert(
             "No Signal Generated Today",
             "The trading window has ended and no signal was generated. "
@@ -161,28 +316,29 @@ def check_poke_health():
     if not (TRADING_WINDOW_START <= now.time() <= TRADING_WINDOW_END):
         return
 
-    with _lock:
-        last_poke = _state['last_poke_time']
-        alert_key = f"poke_stale_{now.strftime('%Y-%m-%d')}"
-        already_sent = alert_key in _state['alerts_sent_today']
-
-    if already_sent:
+    today = _date_str(now)
+    alert_key = f"poke_stale_{today}"
+    if alert_key in _state['alerts_sent_today']:
         return
 
     # If we're 30+ min into trading window and no poke has fired
+    last_poke = _state['last_poke_time']
     if last_poke is None or (now - last_poke).total_seconds() > 1800:
-        with _lock:
-            _state['alerts_sent_today'].add(alert_key)
-        _send_alert(
-            "Poke Thread Stale",
-            "No poke has fired in the last 30 minutes during the trading window. "
-            "The scheduler may have crashed.",
-            level='warning',
-        )
+        if _claim_alert(alert_key, today):
+            _send_alert(
+                "Poke Thread Stale",
+                "No poke has fired in the last 30 minutes during the trading window. "
+                "The scheduler may have crashed.",
+                level='warning',
+            )
 
 
 def reset_daily():
-    """Reset daily alert dedup. Call this at midnight or start of day."""
+    """Reset daily alert dedup immediately.
+
+    Not required for correctness: the dedup set also rolls over on its own
+    at the first alert check of a new ET day.
+    """
     with _lock:
         _state['alerts_sent_today'] = set()
 
@@ -196,5 +352,5 @@ def get_alert_status():
             'last_poke_time': _state['last_poke_time'].isoformat() if _state['last_poke_time'] else None,
             'consecutive_api_failures': _state['consecutive_api_failures'],
             'api_failure_source': _state['api_failure_source'],
-            'alerts_sent_today': list(_state['alerts_sent_today']),
+            'alerts_sent_today': len(_state['alerts_sent_today']),
         }
@@ -1,5 +1,5 @@
 """Data fetching module"""
-from .market_data import get_spx_data_with_retry, get_vix1d_with_retry, get_vix_with_retry, get_vvix_with_retry, get_spx_snapshot, get_vix1d_snapshot, get_vix_snapshot, get_vvix_snapshot, get_spx_aggregates
+from .market_data import get_spx_data_with_retry, get_vix1d_with_retry, get_vix_with_retry, get_vvix_with_retry, get_spx_snapshot, get_vix1d_snapshot, get_vix_snapshot, get_vvix_snapshot, get_spx_aggregates, prefetch_index_snapshots
 from .news_fetcher import fetch_news_raw
 from .earnings_calendar import check_mag7_earnings
 from .oa_event_calendar import check_oa_event_gates, format_gate_reasons
@@ -14,6 +14,7 @@ __all__ = [
     'get_vix_snapshot',
     'get_vvix_snapshot',
     'get_spx_aggregates',
+    'prefetch_index_snapshots',
     'fetch_news_raw',
     'check_mag7_earnings',
     'check_oa_event_gates',
@@ -3,10 +3,10 @@
 Uses Polygon's ticker events API to detect upcoming Mag 7 earnings.
 Returns a risk modifier to add to the GPT news score.
 """
-import requests
 from datetime import datetime, timedelta
 import pytz
 from core.config import get_config
+from core.http import SESSION, json_body
 
 ET_TZ = pytz.timezone('US/Eastern')
 
@@ -80,11 +80,11 @@ def _get_next_earnings_date(ticker, api_key):
             f"&date.gte={datetime.now(ET_TZ).strftime('%Y-%m-%d')}"
             f"&apiKey={api_key}"
         )
-        resp = requests.get(url, timeout=10)
+        resp = SESSION.get(url, timeout=10)
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = json_body(resp)
         events = data.get('results', {}).get('events', [])
         if not events:
             return None
@@ -1,13 +1,94 @@
 """Market data fetching from Polygon API"""
-import requests
+import functools
 import time as time_module
+import traceback
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 import pytz
+import requests
 from core.config import get_config
+from core.http import SESSION, json_body
 
 ET_TZ = pytz.timezone('US/Eastern')
 
+# Short-lived snapshot cache. Every overnight bot polls the same indices on the
+# same poke and the data is 15-min delayed, so one fetch per ticker per minute
+# serves all of them (and skips the retry sleeps on a hit). The SPX daily
+# aggregates share it under their own key. Failures are not cached.
+SNAPSHOT_TTL_SECONDS = 60
+_SNAPSHOT_CACHE = {}
+
+
+def _ttl_cached_snapshot(ticker):
+    """Serve the wrapped snapshot fetcher's last good result for SNAPSHOT_TTL_SECONDS."""
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper():
+            cached = _SNAPSHOT_CACHE.get(ticker)
+            if cached and time_module.monotonic() - cached[0] < SNAPSHOT_TTL_SECONDS:
+                return cached[1]
+            snapshot = fetch()
+            if snapshot:
+                _SNAPSHOT_CACHE[ticker] = (time_module.monotonic(), snapshot)
+            return snapshot
+        return wrapper
+    return decorator
+
+
+def _day_range(lookback_days):
+    """(start, end) YYYY-MM-DD strings for a daily-aggregates query ending today (ET)."""
+    today = datetime.now(ET_TZ).date()
+    return (today - timedelta(days=lookback_days)).isoformat(), today.isoformat()
+
+
+def _snapshot_from_result(ticker_data):
+    """Snapshot dict for one entry of a /v3/snapshot/indices 'results' list."""
+    return {
+        'current': ticker_data.get('value'),
+        'session': ticker_data.get('session', {}),
+        'timeframe': ticker_data.get('timeframe'),
+        'market_status': ticker_data.get('market_status')
+    }
+
+
+def prefetch_index_snapshots(tickers):
+    """Warm the snapshot cache for several indices with a single Polygon call.
+
+    The snapshot endpoint accepts a comma-separated ticker.any_of, so one
+    request can replace one per index. Best effort: tickers that are missing
+    from the reply (or the whole call failing) are simply left to their own
+    get_*_snapshot() fetch and retry.
+    """
+    now = time_module.monotonic()
+    missing = [ticker for ticker in tickers
+               if not (ticker in _SNAPSHOT_CACHE and now - _SNAPSHOT_CACHE[ticker][0] < SNAPSHOT_TTL_SECONDS)]
+    if not missing:
+        return
+
+    config = get_config()
+    polygon_api_key = config.get('POLYGON_API_KEY')
 
+    try:
+        print(f"  [POLYGON] Fetching snapshots: {', '.join(missing)}...")
+        url = f"https://api.massive.com/v3/snapshot/indices?ticker.any_of={','.join(missing)}&apiKey={polygon_api_key}"
+        response = SESSION.get(url, timeout=15)
+        if response.status_code != 200:
+            print(f"  ⚠️ Batched snapshot failed: {response.status_code} — fetching individually")
+            return
+
+        fetched_at = time_module.monotonic()
+        for ticker_data in json_body(response).get('results', []):
+            ticker = ticker_data.get('ticker')
+            if ticker in missing and 'error' not in ticker_data and ticker_data.get('value') is not None:
+                _SNAPSHOT_CACHE[ticker] = (fetched_at, _snapshot_from_result(ticker_data))
+    except requests.RequestException as e:
+        print(f"  ⚠️ Batched snapshot error: {e} — fetching individually")
+    except Exception as e:
+        print(f"  ⚠️ Batched snapshot error: {e} — fetching individually")
+        traceback.print_exc()
+
+
+@_ttl_cached_snapshot('I:SPX')
 def get_spx_snapshot():
     """
     Fetch ONLY SPX current value from Polygon snapshot
@@ -20,13 +101,13 @@ def get_spx_snapshot():
         print("  [POLYGON] Fetching SPX snapshot...")
         
         url = f"https://api.massive.com/v3/snapshot/indices?ticker.any_of=I:SPX&apiKey={polygon_api_key}"
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
         
         if response.status_code != 200:
             print(f"  ❌ SPX snapshot failed: {response.status_code}")
             return None
         
-        data = response.json()
+        data = json_body(response)
         
         if 'results' not in data or len(data['results']) == 0:
             print(f"  ❌ No SPX results in snapshot")
@@ -42,24 +123,23 @@ def get_spx_snapshot():
             print(f"  ❌ Unexpected ticker: {ticker_data.get('ticker')}")
             return None
         
-        spx_snapshot = {
-            'current': ticker_data.get('value'),
-            'session': ticker_data.get('session', {}),
-            'timeframe': ticker_data.get('timeframe'),
-            'market_status': ticker_data.get('market_status')
-        }
+        spx_snapshot = _snapshot_from_result(ticker_data)
         
         print(f"  ✅ SPX: {spx_snapshot['current']:.2f} ({spx_snapshot['timeframe']})")
         
         return spx_snapshot
         
+    except requests.RequestException as e:
+        # Timeouts / connection drops are routine; the message is enough
+        print(f"  ❌ SPX snapshot error: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ SPX snapshot error: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
+@_ttl_cached_snapshot('I:VIX1D')
 def get_vix1d_snapshot():
     """
     Fetch ONLY VIX1D current value from Polygon snapshot
@@ -72,13 +152,13 @@ def get_vix1d_snapshot():
         print("  [POLYGON] Fetching VIX1D snapshot...")
         
         url = f"https://api.massive.com/v3/snapshot/indices?ticker.any_of=I:VIX1D&apiKey={polygon_api_key}"
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
         
         if response.status_code != 200:
             print(f"  ❌ VIX1D snapshot failed: {response.status_code}")
             return None
         
-        data = response.json()
+        data = json_body(response)
         
         if 'results' not in data or len(data['results']) == 0:
             print(f"  ❌ No VIX1D results in snapshot")
@@ -94,24 +174,22 @@ def get_vix1d_snapshot():
             print(f"  ❌ Unexpected ticker: {ticker_data.get('ticker')}")
             return None
         
-        vix1d_snapshot = {
-            'current': ticker_data.get('value'),
-            'session': ticker_data.get('session', {}),
-            'timeframe': ticker_data.get('timeframe'),
-            'market_status': ticker_data.get('market_status')
-        }
+        vix1d_snapshot = _snapshot_from_result(ticker_data)
         
         print(f"  ✅ VIX1D: {vix1d_snapshot['current']:.2f} ({vix1d_snapshot['timeframe']})")
         
         return vix1d_snapshot
         
+    except requests.RequestException as e:
+        print(f"  ❌ VIX1D snapshot error: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ VIX1D snapshot error: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
+@_ttl_cached_snapshot('I:SPX:aggs')
 def get_spx_aggregates():
     """
     Fetch ONLY SPX historical data for RV calculation
@@ -123,18 +201,17 @@ def get_spx_aggregates():
     try:
         print("  [POLYGON] Fetching SPX historical data...")
         
-        end_date = datetime.now(ET_TZ)
-        start_date = end_date - timedelta(days=40)
+        start_str, end_str = _day_range(40)
         
-        url = f"https://api.massive.com/v2/aggs/ticker/I:SPX/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}?adjusted=true&sort=desc&limit=50&apiKey={polygon_api_key}"
+        url = f"https://api.massive.com/v2/aggs/ticker/I:SPX/range/1/day/{start_str}/{end_str}?adjusted=true&sort=desc&limit=50&apiKey={polygon_api_key}"
         
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
         
         if response.status_code != 200:
             print(f"  ❌ SPX aggregates failed: {response.status_code}")
             return None
         
-        data = response.json()
+        data = json_body(response)
         
         if 'results' not in data or len(data['results']) == 0:
             print(f"  ❌ No SPX historical data")
@@ -148,13 +225,16 @@ def get_spx_aggregates():
 
         return {'closes': closes, 'opens': opens}
         
+    except requests.RequestException as e:
+        print(f"  ❌ SPX aggregates error: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ SPX aggregates error: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
+@_ttl_cached_snapshot('I:VIX')
 def get_vix_snapshot():
     """
     Fetch VIX (30-day) current value from Polygon snapshot.
@@ -167,13 +247,13 @@ def get_vix_snapshot():
         print("  [POLYGON] Fetching VIX (30-day) snapshot...")
 
         url = f"https://api.massive.com/v3/snapshot/indices?ticker.any_of=I:VIX&apiKey={polygon_api_key}"
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
 
         if response.status_code != 200:
             print(f"  ❌ VIX snapshot failed: {response.status_code}")
             return None
 
-        data = response.json()
+        data = json_body(response)
 
         if 'results' not in data or len(data['results']) == 0:
             print(f"  ❌ No VIX results in snapshot")
@@ -189,20 +269,17 @@ def get_vix_snapshot():
             print(f"  ❌ Unexpected ticker: {ticker_data.get('ticker')}")
             return None
 
-        vix_snapshot = {
-            'current': ticker_data.get('value'),
-            'session': ticker_data.get('session', {}),
-            'timeframe': ticker_data.get('timeframe'),
-            'market_status': ticker_data.get('market_status')
-        }
+        vix_snapshot = _snapshot_from_result(ticker_data)
 
         print(f"  ✅ VIX (30-day): {vix_snapshot['current']:.2f} ({vix_snapshot['timeframe']})")
 
         return vix_snapshot
 
+    except requests.RequestException as e:
+        print(f"  ❌ VIX snapshot error: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ VIX snapshot error: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -276,6 +353,7 @@ def get_spx_data_with_retry(max_retries=3):
     return None
 
 
+@_ttl_cached_snapshot('I:VVIX')
 def get_vvix_snapshot():
     """
     Fetch VVIX (VIX-of-VIX) current value from Polygon snapshot.
@@ -288,13 +366,13 @@ def get_vvix_snapshot():
         print("  [POLYGON] Fetching VVIX snapshot...")
 
         url = f"https://api.massive.com/v3/snapshot/indices?ticker.any_of=I:VVIX&apiKey={polygon_api_key}"
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
 
         if response.status_code != 200:
             print(f"  ❌ VVIX snapshot failed: {response.status_code}")
             return None
 
-        data = response.json()
+        data = json_body(response)
 
         if 'results' not in data or len(data['results']) == 0:
             print(f"  ❌ No VVIX results in snapshot")
@@ -310,20 +388,17 @@ def get_vvix_snapshot():
             print(f"  ❌ Unexpected ticker: {ticker_data.get('ticker')}")
             return None
 
-        vvix_snapshot = {
-            'current': ticker_data.get('value'),
-            'session': ticker_data.get('session', {}),
-            'timeframe': ticker_data.get('timeframe'),
-            'market_status': ticker_data.get('market_status')
-        }
+        vvix_snapshot = _snapshot_from_result(ticker_data)
 
         print(f"  ✅ VVIX: {vvix_snapshot['current']:.2f} ({vvix_snapshot['timeframe']})")
 
         return vvix_snapshot
 
+    except requests.RequestException as e:
+        print(f"  ❌ VVIX snapshot error: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ VVIX snapshot error: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -371,7 +446,10 @@ def vvix_static_bucket(vvix_value):
 # ─────────────────────────────────────────────────────────────────────────────
 # Caches the trailing 252-trading-day VVIX close window so the 5 paper bots
 # × 3 pokes/day all share one Polygon fetch (= 1 fetch per ET calendar day).
-_VVIX_HISTORY_CACHE = {'date': None, 'closes': []}
+# Held as one (date, closes, sorted_closes) tuple, swapped in with a single
+# assignment, so a concurrent trigger never ranks one day's value against
+# another day's (or an empty) sorted copy.
+_VVIX_HISTORY_CACHE = (None, [], [])
 
 
 def get_vvix_aggregates(lookback_calendar_days=400):
@@ -386,20 +464,19 @@ def get_vvix_aggregates(lookback_calendar_days=400):
 
     try:
         print("  [POLYGON] Fetching VVIX historical aggregates...")
-        end_date = datetime.now(ET_TZ)
-        start_date = end_date - timedelta(days=lookback_calendar_days)
+        start_str, end_str = _day_range(lookback_calendar_days)
 
         url = (
             f"https://api.massive.com/v2/aggs/ticker/I:VVIX/range/1/day/"
-            f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+            f"{start_str}/{end_str}"
             f"?adjusted=true&sort=asc&limit=1000&apiKey={polygon_api_key}"
         )
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, timeout=15)
         if response.status_code != 200:
             print(f"  ❌ VVIX aggregates failed: HTTP {response.status_code}")
             return None
 
-        data = response.json()
+        data = json_body(response)
         if 'results' not in data or not data['results']:
             print(f"  ❌ No VVIX historical data in response")
             return None
@@ -419,18 +496,26 @@ def get_vvix_252d_history():
     later pokes within the same day are O(1). On a failure day, every poke
     re-attempts the fetch (failures are not cached).
     """
+    entry = _vvix_history_entry()
+    return entry[1] if entry else None
+
+
+def _vvix_history_entry():
+    """Today's (date, closes, sorted_closes) cache entry, fetched on a miss; None on failure."""
+    global _VVIX_HISTORY_CACHE
     today_str = datetime.now(ET_TZ).strftime('%Y-%m-%d')
-    if _VVIX_HISTORY_CACHE['date'] == today_str and _VVIX_HISTORY_CACHE['closes']:
-        return _VVIX_HISTORY_CACHE['closes']
+    entry = _VVIX_HISTORY_CACHE
+    if entry[0] == today_str and entry[1]:
+        return entry
 
     all_closes = get_vvix_aggregates(lookback_calendar_days=400)
     if not all_closes:
         return None
 
     trailing = all_closes[-252:] if len(all_closes) >= 252 else all_closes
-    _VVIX_HISTORY_CACHE['date'] = today_str
-    _VVIX_HISTORY_CACHE['closes'] = trailing
-    return trailing
+    entry = (today_str, trailing, sorted(trailing))
+    _VVIX_HISTORY_CACHE = entry
+    return entry
 
 
 def _percentile_rank(value, sorted_values):
@@ -442,8 +527,8 @@ def _percentile_rank(value, sorted_values):
     n = len(sorted_values)
     if n == 0:
         return None
-    below = sum(1 for v in sorted_values if v < value)
-    equal = sum(1 for v in sorted_values if v == value)
+    below = bisect_left(sorted_values, value)
+    equal = bisect_right(sorted_values, value) - below
     rank = below + 0.5 * equal
     return 100.0 * rank / n
 
@@ -455,18 +540,23 @@ def vvix_percentile_252d(current_vvix, min_sample=60):
     (< `min_sample` bars). Caller should treat None as a signal to fall back to
     vvix_static_bucket().
     """
+    return _vvix_percentile_and_sample(current_vvix, min_sample)[0]
+
+
+def _vvix_percentile_and_sample(current_vvix, min_sample=60):
+    """(percentile, sample_size) from one cache entry; (None, 0) when unavailable."""
     if current_vvix is None:
-        return None
+        return None, 0
     try:
         cv = float(current_vvix)
     except (TypeError, ValueError):
-        return None
+        return None, 0
 
-    history = get_vvix_252d_history()
-    if not history or len(history) < min_sample:
-        return None
+    entry = _vvix_history_entry()
+    if not entry or len(entry[1]) < min_sample:
+        return None, 0
 
-    return _percentile_rank(cv, sorted(history))
+    return _percentile_rank(cv, entry[2]), len(entry[1])
 
 
 def vvix_percentile_bucket(current_vvix):
@@ -482,7 +572,7 @@ def vvix_percentile_bucket(current_vvix):
     `source` is 'percentile_252d' on success or 'static_fallback' when history
     is unavailable.
     """
-    pct = vvix_percentile_252d(current_vvix)
+    pct, sample_size = _vvix_percentile_and_sample(current_vvix)
     if pct is None:
         bucket = vvix_static_bucket(current_vvix)
         return (bucket, None, 0, 'static_fallback')
@@ -496,7 +586,6 @@ def vvix_percentile_bucket(current_vvix):
     else:
         bucket = 'EXTREME'
 
-    sample_size = len(_VVIX_HISTORY_CACHE.get('closes') or [])
     return (bucket, round(pct, 1), sample_size, 'percentile_252d')
 
 
@@ -1,65 +1,109 @@
 """News fetching from multiple RSS sources - RAW DATA ONLY"""
-import requests
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from dateutil import parser as date_parser
 import pytz
 
+from core.http import SESSION
+
 ET_TZ = pytz.timezone('US/Eastern')
 
 
+def _parse_pubdate(pubdate):
+    """Parse an RSS <pubDate> into an ET-aware datetime. Returns None if unparseable.
+
+    RSS dates are RFC-822, which the stdlib parses directly; dateutil's
+    heuristic parser is only tried for feeds that stray from the format.
+    """
+    try:
+        pub_time = parsedate_to_datetime(pubdate)
+        if pub_time.tzinfo is None:
+            # Naive here means either RFC-822 "-0000" (UTC, no local offset
+            # given) or no zone at all, which is read as ET below.
+            if pubdate.rstrip().endswith('-0000'):
+                pub_time = pytz.utc.localize(pub_time)
+    except (TypeError, ValueError):
+        try:
+            pub_time = date_parser.parse(pubdate)
+        except (ValueError, OverflowError):
+            return None
+    if pub_time.tzinfo is None:
+        return ET_TZ.localize(pub_time)
+    return pub_time.astimezone(ET_TZ)
+
+
+# Validators and parsed items from each feed's last 200 response, keyed by
+# URL. They are sent back as a conditional GET, so an unchanged feed answers
+# 304 with no body and is not re-parsed.
+_FEED_CACHE = {}
+
+
+def _parse_feed_items(response, source_name):
+    """Stream-parse an RSS response into (title, link, description, pub_time) tuples."""
+    items = []
+    # Feed the (gzip-decoded) socket stream straight into the parser and
+    # clear each <item> once read, so the feed is never held in memory
+    # as one bytes blob plus a full tree.
+    response.raw.decode_content = True
+    for _, item in ET.iterparse(response.raw, events=('end',)):
+        if item.tag != 'item':
+            continue
+        try:
+            pubdate = item.findtext('pubDate')
+            items.append((
+                item.findtext('title') or 'No title',
+                item.findtext('link') or '',
+                item.findtext('description') or '',
+                _parse_pubdate(pubdate) if pubdate else None,
+            ))
+        except Exception as e:
+            print(f"Error parsing item from {source_name}: {e}")
+        item.clear()
+    return items
+
+
 def parse_rss_feed(url, source_name):
     """Parse RSS feed using direct HTTP + XML parsing"""
     try:
-        response = requests.get(
-            url, 
-            timeout=15, 
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        )
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        articles = []
         now = datetime.now(ET_TZ)
         
-        for item in root.findall('.//item'):
-            try:
-                title_elem = item.find('title')
-                title = title_elem.text if title_elem is not None and title_elem.text else 'No title'
-                
-                link_elem = item.find('link')
-                link = link_elem.text if link_elem is not None and link_elem.text else ''
-                
-                description_elem = item.find('description')
-                description = description_elem.text if description_elem is not None and description_elem.text else ''
-                
-                pubdate_elem = item.find('pubDate')
-                if pubdate_elem is not None and pubdate_elem.text:
-                    try:
-                        pub_time = date_parser.parse(pubdate_elem.text)
-                        if pub_time.tzinfo is None:
-                            pub_time = ET_TZ.localize(pub_time)
-                        else:
-                            pub_time = pub_time.astimezone(ET_TZ)
-                    except:
-                        pub_time = now
+        headers = {}
+        cached = _FEED_CACHE.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        with SESSION.get(url, timeout=15, stream=True, headers=headers) as response:
+            if cached and response.status_code == 304:
+                items = cached[2]
+            else:
+                response.raise_for_status()
+                items = _parse_feed_items(response, source_name)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    _FEED_CACHE[url] = (etag, last_modified, items)
                 else:
-                    pub_time = now
-                
-                hours_ago = (now - pub_time).total_seconds() / 3600
-                
-                articles.append({
-                    'title': title,
-                    'published_time': pub_time,
-                    'hours_ago': hours_ago,
-                    'source': source_name,
-                    'description': description,
-                    'link': link
-                })
-                
-            except Exception as e:
-                print(f"Error parsing item from {source_name}: {e}")
-                continue
+                    _FEED_CACHE.pop(url, None)
+        
+        # Fresh dicts every call: hours_ago is relative to this cycle and
+        # later layers tag the articles in place.
+        articles = []
+        for title, link, description, pub_time in items:
+            pub_time = pub_time or now
+            articles.append({
+                'title': title,
+                'published_time': pub_time,
+                'hours_ago': (now - pub_time).total_seconds() / 3600,
+                'source': source_name,
+                'description': description,
+                'link': link
+            })
         
         return articles
         
@@ -68,27 +112,47 @@ def parse_rss_feed(url, source_name):
         return []
 
 
+YAHOO_FINANCE_FEEDS = [
+    ('https://finance.yahoo.com/news/rssindex', 'Yahoo Finance - Market'),
+    ('https://finance.yahoo.com/rss/headline?s=^GSPC', 'Yahoo Finance - S&P 500'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=AAPL&region=US&lang=en-US', 'Yahoo Finance - Apple'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=MSFT&region=US&lang=en-US', 'Yahoo Finance - Microsoft'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=GOOGL&region=US&lang=en-US', 'Yahoo Finance - Google'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=AMZN&region=US&lang=en-US', 'Yahoo Finance - Amazon'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=NVDA&region=US&lang=en-US', 'Yahoo Finance - Nvidia'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=TSLA&region=US&lang=en-US', 'Yahoo Finance - Tesla'),
+    ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=META&region=US&lang=en-US', 'Yahoo Finance - Meta'),
+]
+
+GOOGLE_NEWS_QUERIES = [
+    'stock+market+OR+S%26P+500',
+    'earnings+OR+guidance',
+    'Apple+OR+Microsoft+OR+Google+OR+Amazon',
+    'Nvidia+OR+Tesla+OR+Meta',
+    'Federal+Reserve+OR+inflation'
+]
+
+GOOGLE_NEWS_FEEDS = [
+    (f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en", 'Google News')
+    for query in GOOGLE_NEWS_QUERIES
+]
+
+# One worker per feed: the fan-out is pure network wait, so wall time drops
+# from the sum of feed latencies to roughly the slowest single feed.
+MAX_FEED_WORKERS = len(YAHOO_FINANCE_FEEDS) + len(GOOGLE_NEWS_FEEDS)
+
+
+def _fetch_feeds(feeds):
+    """Fetch and parse (url, source_name) feeds concurrently, flattened in feed order."""
+    with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(feeds))) as executor:
+        results = executor.map(lambda feed: parse_rss_feed(*feed), feeds)
+        return [article for articles in results for article in articles]
+
+
 def fetch_yahoo_finance_news():
     """Source 1: Yahoo Finance RSS"""
     try:
-        rss_feeds = [
-            ('https://finance.yahoo.com/news/rssindex', 'Yahoo Finance - Market'),
-            ('https://finance.yahoo.com/rss/headline?s=^GSPC', 'Yahoo Finance - S&P 500'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=AAPL&region=US&lang=en-US', 'Yahoo Finance - Apple'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=MSFT&region=US&lang=en-US', 'Yahoo Finance - Microsoft'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=GOOGL&region=US&lang=en-US', 'Yahoo Finance - Google'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=AMZN&region=US&lang=en-US', 'Yahoo Finance - Amazon'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=NVDA&region=US&lang=en-US', 'Yahoo Finance - Nvidia'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=TSLA&region=US&lang=en-US', 'Yahoo Finance - Tesla'),
-            ('https://feeds.finance.yahoo.com/rss/2.0/headline?s=META&region=US&lang=en-US', 'Yahoo Finance - Meta'),
-        ]
-        
-        all_articles = []
-        for feed_url, feed_name in rss_feeds:
-            articles = parse_rss_feed(feed_url, feed_name)
-            all_articles.extend(articles)
-        
-        return all_articles
+        return _fetch_feeds(YAHOO_FINANCE_FEEDS)
         
     except Exception as e:
         print(f"ERROR in Yahoo Finance: {e}")
@@ -98,21 +162,7 @@ def fetch_yahoo_finance_news():
 def fetch_google_news_rss():
     """Source 2: Google News RSS"""
     try:
-        queries = [
-            'stock+market+OR+S%26P+500',
-            'earnings+OR+guidance',
-            'Apple+OR+Microsoft+OR+Google+OR+Amazon',
-            'Nvidia+OR+Tesla+OR+Meta',
-            'Federal+Reserve+OR+inflation'
-        ]
-        
-        all_articles = []
-        for query in queries:
-            url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
-            articles = parse_rss_feed(url, 'Google News')
-            all_articles.extend(articles)
-        
-        return all_articles
+        return _fetch_feeds(GOOGLE_NEWS_FEEDS)
         
     except Exception as e:
         print(f"ERROR in Google News: {e}")
@@ -120,17 +170,12 @@ def fetch_google_news_rss():
 
 
 def fetch_news_raw():
-    """Fetch raw news from all sources - NO PROCESSING"""
+    """Fetch raw news from all sources - NO PROCESSING
+
+    Yahoo and Google feeds are fetched in a single concurrent fan-out.
+    """
     try:
-        all_articles = []
-        
-        yahoo_articles = fetch_yahoo_finance_news()
-        google_articles = fetch_google_news_rss()
-        
-        all_articles.extend(yahoo_articles)
-        all_articles.extend(google_articles)
-        
-        return all_articles
+        return _fetch_feeds(YAHOO_FINANCE_FEEDS + GOOGLE_NEWS_FEEDS)
         
     except Exception as e:
         print(f"CRITICAL ERROR in fetch_news_raw: {e}")
@@ -0,0 +1,58 @@
+"""Shared HTTP session with connection pooling.
+
+Every outbound call (Polygon, RSS feeds, OpenAI, Option Alpha and Slack
+webhooks, the scheduler's self-pokes and the backtest/validation scripts) goes
+through SESSION so repeated requests to the same host reuse a keep-alive
+TCP+TLS connection instead of paying a fresh handshake per call.
+
+Retries here cover connection failures only (read=False, status=0, Retry-After
+ignored): a request that reached the server is never re-sent by the adapter,
+so a 429/503 comes straight back to the caller and callers' own retry loops
+stay the single source of truth for application-level retries. read=False
+(rather than 0) re-raises a read timeout as requests' ReadTimeout instead of
+wrapping it in a ConnectionError.
+
+JSON bodies are encoded/decoded with orjson, which parses Polygon's aggregate
+payloads several times faster than the stdlib json module behind response.json().
+"""
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+POOL_CONNECTIONS = 16   # distinct hosts kept warm
+POOL_MAXSIZE = 32       # concurrent connections per host
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, connect=3, read=False, status=0, backoff_factor=0.3,
+                          respect_retry_after_header=False),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+SESSION = _build_session()
+
+
+def json_body(response):
+    """Decode a response body as JSON (orjson; drop-in for response.json())."""
+    return orjson.loads(response.content)
+
+
+def post_json(url, payload, timeout=10):
+    """POST payload as an orjson-encoded JSON body through the shared session."""
+    return SESSION.post(
+        url,
+        data=orjson.dumps(payload),
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout,
+    )
@@ -1,22 +1,96 @@
 """Layer 1: News deduplication with fuzzy matching"""
+import functools
 import re
+from collections import defaultdict
 from difflib import SequenceMatcher
 
+SIMILARITY_THRESHOLD = 0.85
 
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+SOURCE_PRIORITY = {
+    'Reuters': 1,
+    'Bloomberg': 2,
+    'Google News': 3,
+    'Yahoo Finance': 4,
+    'CNBC': 5,
+    'MarketWatch': 6,
+    'Other': 99
+}
+
+_SOURCE_PRIORITY_LOWER = {name.lower(): prio for name, prio in SOURCE_PRIORITY.items()}
+_SOURCE_RE = re.compile(
+    '|'.join(re.escape(name) for name in SOURCE_PRIORITY if name != 'Other'),
+    re.IGNORECASE,
+)
+
+
+def get_source_priority(source):
+    """Priority of a source name (lower is better). Best match wins if several appear."""
+    matches = _SOURCE_RE.findall(source or '')
+    if not matches:
+        return SOURCE_PRIORITY['Other']
+    return min(_SOURCE_PRIORITY_LOWER[m.lower()] for m in matches)
+
+
+# ASCII fast path for normalize_title: bytes.translate lowercases and drops
+# exactly the characters _NON_WORD_RE would (note '_' is \w and is kept) in
+# one C pass. Non-ASCII titles take the regex path.
+_ASCII_LOWER_TABLE = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+_ASCII_NON_WORD = bytes(code for code in range(128) if _NON_WORD_RE.match(chr(code)))
+
+
+# Every desk's cycle dedups the same feed titles on the same poke, and most
+# titles survive from one poke to the next, so normalized forms are memoized.
+@functools.lru_cache(maxsize=4096)
 def normalize_title(title):
     """Normalize title for comparison"""
-    normalized = title.lower()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = ' '.join(normalized.split())
-    return normalized
+    if title.isascii():
+        normalized = title.encode('ascii').translate(
+            _ASCII_LOWER_TABLE, _ASCII_NON_WORD).decode('ascii')
+    else:
+        normalized = _NON_WORD_RE.sub('', title.lower())
+    return ' '.join(normalized.split())
+
+
+def _matcher_similar(matcher, norm1, threshold=SIMILARITY_THRESHOLD):
+    """Compare norm1 against the normalized title already loaded as matcher's seq2.
 
+    Cheap upper bounds run first: the length bound, then real_quick_ratio()
+    and quick_ratio(). Each is >= ratio(), so rejecting on them never drops
+    a true match; only survivors pay for the full SequenceMatcher pass.
+    """
+    total = len(norm1) + len(matcher.b)
+    if total == 0:
+        return True
+    if 2 * min(len(norm1), len(matcher.b)) / total < threshold:
+        return False
+    matcher.set_seq1(norm1)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
 
-def titles_are_similar(title1, title2, threshold=0.85):
+
+def _normalized_similar(norm1, norm2, threshold=SIMILARITY_THRESHOLD):
+    """Similarity check for titles that have already been through normalize_title."""
+    return _matcher_similar(SequenceMatcher(None, b=norm2), norm1, threshold)
+
+
+def titles_are_similar(title1, title2, threshold=SIMILARITY_THRESHOLD):
     """Check if two titles are 85%+ similar"""
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
-    similarity = SequenceMatcher(None, norm1, norm2).ratio()
-    return similarity >= threshold
+    return _normalized_similar(normalize_title(title1), normalize_title(title2), threshold)
+
+
+def _length_window(length, threshold=SIMILARITY_THRESHOLD):
+    """Range of normalized-title lengths that can reach `threshold` against `length`.
+
+    SequenceMatcher.ratio() is 2*M / (len_a + len_b) with M <= min(len_a, len_b),
+    so a pair can only be similar when 2*min / (len_a + len_b) >= threshold.
+    Bounds are rounded outward; the real ratio check still decides.
+    """
+    low = int(length * threshold / (2 - threshold))
+    high = int(length * (2 - threshold) / threshold) + 1
+    return low, high
 
 
 def deduplicate_articles_smart(articles):
@@ -24,33 +98,19 @@ def deduplicate_articles_smart(articles):
     if not articles:
         return []
     
-    source_priority = {
-        'Reuters': 1,
-        'Bloomberg': 2,
-        'Google News': 3,
-        'Yahoo Finance': 4,
-        'CNBC': 5,
-        'MarketWatch': 6,
-        'Other': 99
-    }
-    
-    def get_source_priority(article):
-        source = article.get('source', 'Other')
-        for key in source_priority:
-            if key.lower() in source.lower():
-                return source_priority[key]
-        return source_priority['Other']
-    
     articles_sorted = sorted(
         articles,
         key=lambda x: (
             -x['published_time'].timestamp(),
-            get_source_priority(x)
+            get_source_priority(x.get('source', 'Other'))
         )
     )
     
     unique = []
     seen_normalized = {}
+    # Kept titles bucketed by normalized length: a new title is only compared
+    # against buckets whose length could possibly clear the similarity threshold.
+    seen_by_length = defaultdict(list)
     
     for article in articles_sorted:
         title = article['title']
@@ -59,17 +119,23 @@ def deduplicate_articles_smart(articles):
         if norm_title in seen_normalized:
             continue
         
-        is_duplicate = False
-        for seen_norm, seen_data in seen_normalized.items():
-            if titles_are_similar(title, seen_data['original']):
-                is_duplicate = True
-                break
+        low, high = _length_window(len(norm_title))
+        is_duplicate = any(
+            _matcher_similar(seen_data['matcher'], norm_title)
+            for length in range(low, high + 1)
+            for seen_data in seen_by_length.get(length, ())
+        )
         
         if not is_duplicate:
             unique.append(article)
-            seen_normalized[norm_title] = {
+            seen_data = {
                 'original': title,
+                'normalized': norm_title,
+                # seq2 index built once per kept title, reused for every later comparison
+                'matcher': SequenceMatcher(None, b=norm_title),
                 'article': article
             }
+            seen_normalized[norm_title] = seen_data
+            seen_by_length[len(norm_title)].append(seen_data)
     
     return unique
@@ -51,10 +51,12 @@ def process_news_pipeline(raw_articles):
     
     filtered_articles.sort(key=lambda x: x['published_time'], reverse=True)
     
-    # Format for GPT
-    news_summary = ""
+    # Format for GPT. The display time is stored on the article so the trigger
+    # response can reuse it instead of formatting each timestamp again.
+    summary_parts = []
     for article in filtered_articles[:30]:
         time_str = article['published_time'].strftime("%I:%M %p")
+        article['published_time_str'] = time_str
         hours_ago = article['hours_ago']
         
         if hours_ago < 1:
@@ -69,16 +71,16 @@ def process_news_pipeline(raw_articles):
         priority = article.get('priority', 'NORMAL')
         priority_marker = "🔥" if priority == 'HIGH' else ""
         
-        news_summary += f"[{time_str}] {recency} {priority_marker} ({article['source']})\n"
-        news_summary += f"   {article['title']}\n"
+        summary_parts.append(f"[{time_str}] {recency} {priority_marker} ({article['source']})\n")
+        summary_parts.append(f"   {article['title']}\n")
         if article['description']:
             desc = article['description'][:150]
-            news_summary += f"   {desc}...\n"
-        news_summary += "\n"
+            summary_parts.append(f"   {desc}...\n")
+        summary_parts.append("\n")
     
     return {
         'count': len(filtered_articles),
-        'summary': news_summary.strip(),
+        'summary': "".join(summary_parts).strip(),
         'articles': filtered_articles[:30],
         'filter_stats': {
             'raw_articles': raw_count,
@@ -1,20 +1,88 @@
 """Multi-desk poke scheduler.
 
-Background thread that iterates all desks, checks each desk's window,
-and pokes when due. Each desk's window + daily cache is instance state.
+Background thread that sleeps until the next due event (a desk's poke slot,
+the end-of-window check or the midnight alert reset), fires it, and
+reschedules. Each desk's window + daily cache is instance state.
 """
 import os
 import threading
 import time as time_module
-from datetime import datetime, time as dt_time
+from datetime import datetime, timedelta, time as dt_time
 
 import pytz
-import requests
 
 from core.alerting import record_poke, check_end_of_window, reset_daily
+from core.http import SESSION
 
 ET_TZ = pytz.timezone('US/Eastern')
 
+# Window-end check for the "no signal today" alert (desk 1's window, for backward compat)
+END_OF_WINDOW_CHECK = dt_time(14, 31)
+MIDNIGHT = dt_time(0, 0)
+
+# Upper bound on one sleep, so a wall-clock jump (NTP, DST) is noticed quickly
+MAX_SLEEP_SEC = 900
+
+
+def _localize(day, at):
+    return ET_TZ.localize(datetime.combine(day, at))
+
+
+def next_poke_slot(desks, now):
+    """Return (slot, due_desks) for the earliest poke strictly after now.
+
+    A slot is a desk.poke_minutes minute of any hour inside the desk's window
+    on one of its window_days. The window end is exclusive, so an overnight
+    desk (13:30-14:30, minutes [30, 50, 10]) fires at 1:30, 1:50 and 2:10 only.
+    Returns (None, []) if no desk has a slot in the coming week.
+    """
+    best, due = None, []
+    for day_offset in range(8):
+        day = (now + timedelta(days=day_offset)).date()
+        for desk in desks:
+            for hour in range(desk.window_start.hour, desk.window_end.hour + 1):
+                for minute in desk.poke_minutes:
+                    slot = _localize(day, dt_time(hour, minute))
+                    if slot <= now or (best is not None and slot > best):
+                        continue
+                    if slot.time() >= desk.window_end or not desk.is_within_window(slot):
+                        continue
+                    if slot == best:
+                        due.append(desk)
+                    else:
+                        best, due = slot, [desk]
+        if best is not None:
+            break
+    return best, due
+
+
+def _next_daily(now, at, weekdays_only=False):
+    """Next occurrence of wall-clock time `at` (ET) strictly after now."""
+    day = now.date()
+    while True:
+        candidate = _localize(day, at)
+        if candidate > now and (not weekdays_only or candidate.weekday() < 5):
+            return candidate
+        day += timedelta(days=1)
+
+
+def run_end_of_window_check_if_due(now, end_check):
+    """Run check_end_of_window() once now >= end_check; return the next deadline.
+
+    A deadline already in the past (the 2:10 PM triggers overran 2:31 PM) is
+    caught up late rather than skipped. The deadline advances even if the
+    check raises, so a failing check is not retried in a loop.
+    """
+    if now < end_check:
+        return end_check
+    if (now - end_check).total_seconds() >= 60:
+        print(f"[POKE] End-of-window check running late (due {end_check.strftime('%I:%M %p ET')})")
+    try:
+        check_end_of_window()
+    except Exception as e:
+        print(f"[POKE] End-of-window check error: {e}")
+    return _next_daily(now, END_OF_WINDOW_CHECK, weekdays_only=True)
+
 
 def start_scheduler(desks, base_url=None, is_local=False):
     """Start background poke thread for all desks.
@@ -38,41 +106,46 @@ def start_scheduler(desks, base_url=None, is_local=False):
     def _poke_loop():
         print("[POKE] Background thread started")
 
+        # Kept across iterations rather than recomputed: triggers run serially
+        # and can each take up to POKE_TIMEOUT, so if they overrun 2:31 PM the
+        # check is caught up on the next pass instead of rolling to tomorrow.
+        end_check = _next_daily(datetime.now(ET_TZ), END_OF_WINDOW_CHECK, weekdays_only=True)
+
         while True:
             try:
                 now = datetime.now(ET_TZ)
-                current_time = now.time()
+                end_check = run_end_of_window_check_if_due(now, end_check)
+
+                slot, due_desks = next_poke_slot(desks, now)
+                midnight = _next_daily(now, MIDNIGHT)
+                wake_at = min(t for t in (slot, end_check, midnight) if t is not None)
+
+                delay = (wake_at - now).total_seconds()
+                if delay > MAX_SLEEP_SEC:
+                    time_module.sleep(MAX_SLEEP_SEC)
+                    continue
+                time_module.sleep(delay)
 
                 # Reset alert dedup at midnight
-                if current_time.hour == 0 and current_time.minute == 0 and current_time.second < 30:
+                if wake_at == midnight:
                     reset_daily()
 
-                for desk in desks:
-                    desk_id = desk.desk_id
-
-                    if desk.is_within_window(now):
-                        record_poke()
-                        # Fixed-time pokes per desk.poke_minutes (no randomization).
-                        # For overnight desks: [30, 50, 10] → fires at 1:30, 1:50, 2:10
-                        # exactly. The webhook-once-per-day cache in each desk's
-                        # _daily_signal_cache makes pokes 2 and 3 effectively retries
-                        # if poke 1's webhook failed.
-                        if current_time.minute in desk.poke_minutes and current_time.second < 30:
-                            # All desks register at /{desk_id}/trigger — canonical convention.
-                            # See memory/feedback_url_conventions.md for the rule.
-                            trigger_url = f"{base_url}/{desk_id}/trigger"
-
-                            print(f"\n[POKE] {desk_id}: Triggering at {now.strftime('%I:%M %p ET')}")
-                            try:
-                                requests.get(trigger_url, timeout=timeout_sec)
-                            except Exception as e:
-                                print(f"[POKE] {desk_id} Error: {e}")
-
-                # Check if any window just ended (use desk 1's window for backward compat)
-                if dt_time(14, 31) <= current_time <= dt_time(14, 35) and now.weekday() < 5:
-                    check_end_of_window()
-
-                time_module.sleep(30)
+                if wake_at == slot:
+                    record_poke()
+                    # Fixed-time pokes per desk.poke_minutes (no randomization).
+                    # The webhook-once-per-day cache in each desk's
+                    # _daily_signal_cache makes later pokes effectively retries
+                    # if an earlier poke's webhook failed.
+                    for desk in due_desks:
+                        # All desks register at /{desk_id}/trigger — canonical convention.
+                        # See memory/feedback_url_conventions.md for the rule.
+                        trigger_url = f"{base_url}/{desk.desk_id}/trigger"
+
+                        print(f"\n[POKE] {desk.desk_id}: Triggering at {slot.strftime('%I:%M %p ET')}")
+                        try:
+                            SESSION.get(trigger_url, timeout=timeout_sec)
+                        except Exception as e:
+                            print(f"[POKE] {desk.desk_id} Error: {e}")
 
             except Exception as e:
                 print(f"[POKE] Background error: {e}")
@@ -3,10 +3,11 @@
 Parameterized: caller provides the URL map so each desk can use its own webhook URLs.
 """
 import time as time_module
-import requests
 from datetime import datetime
 import pytz
 
+from core.http import post_json
+
 ET_TZ = pytz.timezone('US/Eastern')
 
 MAX_RETRIES = 3
@@ -22,7 +23,7 @@ def _post_with_retry(url, payload):
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = post_json(url, payload, timeout=10)
             success = response.status_code in [200, 201, 202]
 
             if success:
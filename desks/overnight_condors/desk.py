@@ -2,9 +2,9 @@
 
 Extracts the trigger handler from the original monolithic app.py.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import time as dt_time, datetime
 from typing import Dict, List
-import time as time_module
 
 import pytz
 from flask import jsonify
@@ -15,7 +15,7 @@ from core.data.market_data import (
     get_spx_data_with_retry, get_vix1d_with_retry,
     get_vix_with_retry, get_vvix_with_retry,
     get_spx_snapshot, get_vix1d_snapshot, get_vix_snapshot,
-    get_vvix_snapshot, get_spx_aggregates,
+    get_vvix_snapshot, get_spx_aggregates, prefetch_index_snapshots,
 )
 from core.data.news_fetcher import fetch_news_raw
 from core.data.oa_event_calendar import check_oa_event_gates, format_gate_reasons
@@ -24,7 +24,9 @@ from core.webhooks import send_webhook
 from core.alerting import record_signal_success, record_api_failure, _send_alert
 from sheets_logger import log_signal as log_signal_to_sheets
 
+from desks.overnight_condors.config import WEIGHTS
 from desks.overnight_condors.signal_engine import run_signal_analysis
+from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
 
 ET_TZ = pytz.timezone('US/Eastern')
 
@@ -32,6 +34,11 @@ ET_TZ = pytz.timezone('US/Eastern')
 OA_VIX_GATE = 25
 
 
+def _headline_recency(hours_ago):
+    """Recency marker for trigger-response headlines: ! <1h, ~ <3h, - older."""
+    return "!" if hours_ago < 1 else ("~" if hours_ago < 3 else "-")
+
+
 class OvernightCondorsDesk(Desk):
     desk_id = "overnight_condors"
     display_name = "Bot A — Symmetric IC (control)"
@@ -83,34 +90,49 @@ class OvernightCondorsDesk(Desk):
         now = datetime.now(ET_TZ)
         timestamp = now.strftime("%Y-%m-%d %I:%M:%S %p %Z")
 
-        print(f"[{timestamp}] Fetching market data from Polygon...")
-
-        # Fetch SPX data
-        spx_data = get_spx_data_with_retry(max_retries=3)
+        # Market data and news are independent I/O: fetch them concurrently so
+        # the cycle waits for the slowest source rather than the sum of all.
+        print(f"[{timestamp}] Fetching market data from Polygon and news from RSS sources...")
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            news_future = pool.submit(fetch_news_raw)
+            # One batched snapshot call warms the cache for all four indices,
+            # overlapped with the SPX daily aggregates (a separate endpoint),
+            # so the per-index fetchers below only hit Polygon on a miss.
+            aggs_future = pool.submit(get_spx_aggregates)
+            prefetch_index_snapshots(('I:SPX', 'I:VIX1D', 'I:VIX', 'I:VVIX'))
+            aggs_future.result()
+            spx_future = pool.submit(get_spx_data_with_retry, max_retries=3)
+            vix1d_future = pool.submit(get_vix1d_with_retry, max_retries=3)
+            vix_future = pool.submit(get_vix_with_retry, max_retries=2)     # non-critical
+            vvix_future = pool.submit(get_vvix_with_retry, max_retries=2)   # non-critical
+
+        # SPX and VIX1D are required; VIX, VVIX and news degrade gracefully
+        spx_data = spx_future.result()
         if not spx_data:
             record_api_failure('Polygon_SPX', desk_id=self.desk_id)
             return {'error': 'SPX data failed after 3 retries (Polygon)'}
 
-        # Fetch VIX1D
-        vix1d_data = get_vix1d_with_retry(max_retries=3)
+        vix1d_data = vix1d_future.result()
         if not vix1d_data:
             record_api_failure('Polygon_VIX1D', desk_id=self.desk_id)
             return {'error': 'VIX1D data failed after 3 retries (Polygon)'}
 
-        # Fetch VIX (30-day) — non-critical
-        vix_data = get_vix_with_retry(max_retries=2)
+        vix_data = vix_future.result()
+        vvix_data = vvix_future.result()
+        raw_articles = news_future.result()
 
-        # Fetch VVIX — non-critical
-        vvix_data = get_vvix_with_retry(max_retries=2)
-
-        # Fetch and process news
-        print(f"[{timestamp}] Fetching news from RSS sources...")
-        raw_articles = fetch_news_raw()
         print(f"[{timestamp}] Processing news (deduplication + filtering)...")
         news_data = process_news_pipeline(raw_articles)
+        filter_stats = news_data.get("filter_stats", {})
 
+        # The primary (temp 0.1) and confirmation (temp 0.4) GPT passes only
+        # need the news and are independent: run both OpenAI calls at once.
         print(f"[{timestamp}] Analyzing factors...")
-        analysis_result = run_signal_analysis(spx_data, vix1d_data, news_data, vix_data, vvix_data)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            gpt_future = pool.submit(analyze_gpt_news, news_data, temperature=0.1, now=now)
+            gpt_2_future = pool.submit(analyze_gpt_news, news_data, temperature=0.4, now=now)
+        analysis_result = run_signal_analysis(spx_data, vix1d_data, news_data, vix_data, vvix_data,
+                                              gpt=gpt_future.result())
 
         factors = analysis_result['indicators']
         composite = analysis_result['composite']
@@ -122,14 +144,14 @@ class OvernightCondorsDesk(Desk):
         gpt = factors['gpt']
 
         # Log factor details
-        self._log_factors(timestamp, iv_rv, trend, gpt, spx_data, news_data, composite)
+        self._log_factors(timestamp, iv_rv, trend, gpt, spx_data, filter_stats, composite)
 
         # Confirmation pass
         print(f"\n[{timestamp}] ========== CONFIRMATION PASS ==========")
         print(f"[{timestamp}] Running second analysis for signal confirmation (temp=0.4)...")
-        time_module.sleep(2)
 
-        analysis_result_2 = run_signal_analysis(spx_data, vix1d_data, news_data, vix_data, vvix_data, gpt_temperature=0.4)
+        analysis_result_2 = run_signal_analysis(spx_data, vix1d_data, news_data, vix_data, vvix_data,
+                                                gpt=gpt_2_future.result())
         composite_2 = analysis_result_2['composite']
         signal_2 = analysis_result_2['signal']
         contradictions_2 = analysis_result_2.get('contradictions')
@@ -258,7 +280,7 @@ class OvernightCondorsDesk(Desk):
             gpt=gpt,
             spx_current=spx_data["current"],
             vix1d_current=vix1d_data["current"],
-            filter_stats=news_data.get("filter_stats", {}),
+            filter_stats=filter_stats,
             webhook_success=webhook.get("success", False),
             contradictions=contradictions,
             vix_current=vix_current,
@@ -285,59 +307,66 @@ class OvernightCondorsDesk(Desk):
             'news_data': news_data,
             'spx_data': spx_data,
             'vix1d_data': vix1d_data,
-            'filter_stats': news_data.get("filter_stats", {}),
+            'filter_stats': filter_stats,
             'confirmation_pass': confirmation_pass_data,
         }
 
-    def _log_factors(self, timestamp, iv_rv, trend, gpt, spx_data, news_data, composite):
+    def _log_factors(self, timestamp, iv_rv, trend, gpt, spx_data, filter_stats, composite):
         """Detailed console logging for factor analysis."""
-        print(f"\n[{timestamp}] ========== FACTOR ANALYSIS ==========")
-
-        print(f"[{timestamp}] FACTOR 1: IV/RV Ratio (Weight: 30%)")
-        print(f"[{timestamp}]   - VIX1D (Implied Vol): {iv_rv['implied_vol']:.2f}%")
-        print(f"[{timestamp}]   - Realized Vol (10-day): {iv_rv['realized_vol']:.2f}%")
-        print(f"[{timestamp}]   - IV/RV Ratio: {iv_rv['iv_rv_ratio']:.3f}")
+        # One print for the whole block: a single write, and lines from desks
+        # running concurrently cannot interleave inside it.
+        lines = ["", "========== FACTOR ANALYSIS =========="]
+        w_iv_rv, w_trend, w_gpt = WEIGHTS['iv_rv'], WEIGHTS['trend'], WEIGHTS['gpt']
+
+        lines.append(f"FACTOR 1: IV/RV Ratio (Weight: {w_iv_rv:.0%})")
+        lines.append(f"  - VIX1D (Implied Vol): {iv_rv['implied_vol']:.2f}%")
+        lines.append(f"  - Realized Vol (10-day): {iv_rv['realized_vol']:.2f}%")
+        lines.append(f"  - IV/RV Ratio: {iv_rv['iv_rv_ratio']:.3f}")
         if 'rv_change' in iv_rv:
-            print(f"[{timestamp}]   - RV Change: {iv_rv['rv_change']*100:+.2f}%")
+            lines.append(f"  - RV Change: {iv_rv['rv_change']*100:+.2f}%")
         if 'term_structure_ratio' in iv_rv:
-            print(f"[{timestamp}]   - VIX (30-day): {iv_rv.get('vix_30d', 'N/A')}")
-            print(f"[{timestamp}]   - Term Structure: {iv_rv.get('term_structure', 'N/A')} (VIX1D/VIX = {iv_rv['term_structure_ratio']:.3f})")
+            lines.append(f"  - VIX (30-day): {iv_rv.get('vix_30d', 'N/A')}")
+            lines.append(f"  - Term Structure: {iv_rv.get('term_structure', 'N/A')} (VIX1D/VIX = {iv_rv['term_structure_ratio']:.3f})")
             if iv_rv.get('term_modifier', 0) > 0:
-                print(f"[{timestamp}]   - Term Structure Modifier: +{iv_rv['term_modifier']}")
-        print(f"[{timestamp}]   - Factor Score: {iv_rv['score']:.1f}/10")
-        print(f"[{timestamp}]   - Weighted Contribution: {iv_rv['score'] * 0.30:.2f}")
-
-        print(f"[{timestamp}] FACTOR 2: Market Trend (Weight: 20%)")
-        print(f"[{timestamp}]   - SPX Current: {spx_data['current']:.2f}")
-        print(f"[{timestamp}]   - SPX High Today: {spx_data['high_today']:.2f}")
-        print(f"[{timestamp}]   - SPX Low Today: {spx_data['low_today']:.2f}")
-        print(f"[{timestamp}]   - 5-Day Change: {trend['change_5d']*100:+.2f}%")
-        print(f"[{timestamp}]   - Intraday Range: {trend['intraday_range']*100:.2f}%")
-        print(f"[{timestamp}]   - Factor Score: {trend['score']:.1f}/10")
-        print(f"[{timestamp}]   - Weighted Contribution: {trend['score'] * 0.20:.2f}")
-
-        print(f"[{timestamp}] FACTOR 3: GPT News Analysis (Weight: 50%)")
-        filter_stats = news_data.get('filter_stats', {})
-        print(f"[{timestamp}]   - News Pipeline Stats:")
-        print(f"[{timestamp}]     * Raw Articles Fetched: {filter_stats.get('raw_articles', 0)}")
-        print(f"[{timestamp}]     * Duplicates Removed: {filter_stats.get('duplicates_removed', 0)}")
-        print(f"[{timestamp}]     * Unique Articles: {filter_stats.get('unique_articles', 0)}")
-        print(f"[{timestamp}]     * Junk Filtered: {filter_stats.get('junk_filtered', 0)}")
-        print(f"[{timestamp}]     * Sent to GPT: {filter_stats.get('sent_to_gpt', 0)}")
-        print(f"[{timestamp}]   - GPT Analysis:")
-        print(f"[{timestamp}]     * Category: {gpt.get('category', 'UNKNOWN')}")
-        print(f"[{timestamp}]     * Key Risk: {gpt.get('key_risk', 'None')}")
-        print(f"[{timestamp}]     * Direction Risk: {gpt.get('direction_risk', 'UNKNOWN')}")
+                lines.append(f"  - Term Structure Modifier: +{iv_rv['term_modifier']}")
+        lines.append(f"  - Factor Score: {iv_rv['score']:.1f}/10")
+        lines.append(f"  - Weighted Contribution: {iv_rv['score'] * w_iv_rv:.2f}")
+
+        lines.append(f"FACTOR 2: Market Trend (Weight: {w_trend:.0%})")
+        lines.append(f"  - SPX Current: {spx_data['current']:.2f}")
+        lines.append(f"  - SPX High Today: {spx_data['high_today']:.2f}")
+        lines.append(f"  - SPX Low Today: {spx_data['low_today']:.2f}")
+        lines.append(f"  - 5-Day Change: {trend['change_5d']*100:+.2f}%")
+        lines.append(f"  - Intraday Range: {trend['intraday_range']*100:.2f}%")
+        lines.append(f"  - Factor Score: {trend['score']:.1f}/10")
+        lines.append(f"  - Weighted Contribution: {trend['score'] * w_trend:.2f}")
+
+        lines.append(f"FACTOR 3: GPT News Analysis (Weight: {w_gpt:.0%})")
+        lines.append("  - News Pipeline Stats:")
+        lines.append(f"    * Raw Articles Fetched: {filter_stats.get('raw_articles', 0)}")
+        lines.append(f"    * Duplicates Removed: {filter_stats.get('duplicates_removed', 0)}")
+        lines.append(f"    * Unique Articles: {filter_stats.get('unique_articles', 0)}")
+        lines.append(f"    * Junk Filtered: {filter_stats.get('junk_filtered', 0)}")
+        lines.append(f"    * Sent to GPT: {filter_stats.get('sent_to_gpt', 0)}")
+        lines.append("  - GPT Analysis:")
+        lines.append(f"    * Category: {gpt.get('category', 'UNKNOWN')}")
+        lines.append(f"    * Key Risk: {gpt.get('key_risk', 'None')}")
+        lines.append(f"    * Direction Risk: {gpt.get('direction_risk', 'UNKNOWN')}")
         if 'duplicates_found' in gpt:
-            print(f"[{timestamp}]     * Duplicates Found by GPT: {gpt['duplicates_found']}")
-        print(f"[{timestamp}]   - Factor Score: {gpt['score']:.1f}/10")
-        print(f"[{timestamp}]   - Weighted Contribution: {gpt['score'] * 0.50:.2f}")
-        print(f"[{timestamp}]   - GPT Reasoning: {gpt.get('reasoning', 'N/A')[:200]}...")
+            lines.append(f"    * Duplicates Found by GPT: {gpt['duplicates_found']}")
+        lines.append(f"  - Factor Score: {gpt['score']:.1f}/10")
+        lines.append(f"  - Weighted Contribution: {gpt['score'] * w_gpt:.2f}")
+        lines.append(f"  - GPT Reasoning: {gpt.get('reasoning', 'N/A')[:200]}...")
+
+        lines.append("")
+        lines.append("========== COMPOSITE SCORE ==========")
+        lines.append(f"Composite Score: {composite['score']:.1f}/10")
+        lines.append(f"Category: {composite['category']}")
+        lines.append(f"Breakdown: ({iv_rv['score']:.1f} x {w_iv_rv:.2f}) + ({trend['score']:.1f} x {w_trend:.2f}) "
+                     f"+ ({gpt['score']:.1f} x {w_gpt:.2f}) = {composite['score']:.1f}")
 
-        print(f"\n[{timestamp}] ========== COMPOSITE SCORE ==========")
-        print(f"[{timestamp}] Composite Score: {composite['score']:.1f}/10")
-        print(f"[{timestamp}] Category: {composite['category']}")
-        print(f"[{timestamp}] Breakdown: ({iv_rv['score']:.1f} x 0.30) + ({trend['score']:.1f} x 0.20) + ({gpt['score']:.1f} x 0.50) = {composite['score']:.1f}")
+        prefix = f"[{timestamp}] "
+        print("\n".join(prefix + line if line else "" for line in lines))
 
     def register_routes(self, app) -> None:
         """Register Flask routes for this desk."""
@@ -379,14 +408,11 @@ class OvernightCondorsDesk(Desk):
                 filter_stats = result['filter_stats']
 
                 # Format news headlines
-                news_headlines = []
-                if news_data.get('articles'):
-                    for article in news_data['articles'][:25]:
-                        time_str = article['published_time'].strftime("%I:%M %p")
-                        hours_ago = article['hours_ago']
-                        recency = "!" if hours_ago < 1 else ("~" if hours_ago < 3 else "-")
-                        priority = "*" if article.get('priority') == 'HIGH' else ""
-                        news_headlines.append(f"{recency} [{time_str}] {priority}{article['title']}")
+                news_headlines = [
+                    f"{_headline_recency(article['hours_ago'])} [{article['published_time_str']}] "
+                    f"{'*' if article.get('priority') == 'HIGH' else ''}{article['title']}"
+                    for article in (news_data.get('articles') or [])[:25]
+                ]
 
                 return jsonify({
                     "status": "success",
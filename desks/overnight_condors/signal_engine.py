@@ -1,9 +1,20 @@
 """Signal engine: Composite score calculation and signal generation for overnight condors."""
+from bisect import bisect_right
+
+from desks.overnight_condors.config import WEIGHTS
 from desks.overnight_condors.signals.iv_rv_ratio import analyze_iv_rv_ratio
 from desks.overnight_condors.signals.market_trend import analyze_market_trend
 from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
 from core.data.earnings_calendar import check_mag7_earnings
 
+_W_IV_RV = WEIGHTS['iv_rv']
+_W_TREND = WEIGHTS['trend']
+_W_GPT = WEIGHTS['gpt']
+
+# Composite category: a score below each threshold takes that category.
+_CATEGORY_THRESHOLDS = (2.5, 3.5, 5.0, 6.5, 7.5)
+_CATEGORIES = ("EXCELLENT", "VERY_GOOD", "GOOD", "FAIR", "ELEVATED", "HIGH")
+
 
 def detect_contradictions(indicators):
     """Detect when indicators strongly disagree and apply safety overrides.
@@ -60,16 +71,10 @@ def detect_contradictions(indicators):
 
 def calculate_composite_score(indicators, contradiction_result=None):
     """Composite: IV/RV=30%, Trend=20%, GPT=50%"""
-    weights = {'iv_rv': 0.30, 'trend': 0.20, 'gpt': 0.50}
-
-    iv_rv_score = indicators['iv_rv']['score']
-    trend_score = indicators['trend']['score']
-    gpt_score = indicators['gpt']['score']
-
     composite = (
-        iv_rv_score * weights['iv_rv'] +
-        trend_score * weights['trend'] +
-        gpt_score * weights['gpt']
+        indicators['iv_rv']['score'] * _W_IV_RV +
+        indicators['trend']['score'] * _W_TREND +
+        indicators['gpt']['score'] * _W_GPT
     )
 
     # Apply contradiction adjustment
@@ -79,18 +84,7 @@ def calculate_composite_score(indicators, contradiction_result=None):
     composite = round(composite, 1)
     composite = max(1.0, min(10.0, composite))
 
-    if composite < 2.5:
-        category = "EXCELLENT"
-    elif composite < 3.5:
-        category = "VERY_GOOD"
-    elif composite < 5.0:
-        category = "GOOD"
-    elif composite < 6.5:
-        category = "FAIR"
-    elif composite < 7.5:
-        category = "ELEVATED"
-    else:
-        category = "HIGH"
+    category = _CATEGORIES[bisect_right(_CATEGORY_THRESHOLDS, composite)]
 
     return {'score': composite, 'category': category}
 
@@ -131,17 +125,23 @@ def generate_signal(composite_score, contradiction_result=None):
         }
 
 
-def run_signal_analysis(spx_data, vix1d_data, news_data, vix_data=None, vvix_data=None, gpt_temperature=0.1):
+def run_signal_analysis(spx_data, vix1d_data, news_data, vix_data=None, vvix_data=None, gpt_temperature=0.1,
+                        gpt=None):
     """Run all indicators and generate composite signal.
 
     Args:
         gpt_temperature: OpenAI sampling temperature for GPT analysis.
             Default 0.1 for primary pass; confirmation pass uses 0.4.
+        gpt: Precomputed analyze_gpt_news() result. When given, the GPT call
+            is skipped (gpt_temperature is then unused). The dict is adjusted
+            in place by the earnings modifier. The overnight desk passes this,
+            calling analyze_gpt_news with its cycle time itself.
     """
     # Run all three indicators
     iv_rv = analyze_iv_rv_ratio(spx_data, vix1d_data, vix_data, vvix_data)
     trend = analyze_market_trend(spx_data)
-    gpt = analyze_gpt_news(news_data, temperature=gpt_temperature)
+    if gpt is None:
+        gpt = analyze_gpt_news(news_data, temperature=gpt_temperature)
 
     indicators = {'iv_rv': iv_rv, 'trend': trend, 'gpt': gpt}
 
@@ -1,45 +1,81 @@
 """Indicator 3: GPT News Analysis (50% weight)"""
-import json
-import requests
+import copy
+import functools
+import hashlib
+import threading
+import time as time_module
+import traceback
+from collections import OrderedDict
+import orjson
 from datetime import datetime
 import pytz
+import requests
 from core.config import get_config
+from core.http import SESSION, json_body
 
 ET_TZ = pytz.timezone('US/Eastern')
 
 
-def analyze_gpt_news(news_data, temperature=0.1):
-    """LAYER 3: GPT analysis with significance-based time decay model.
+@functools.lru_cache(maxsize=1)
+def _openai_headers(api_key):
+    """Request headers for the OpenAI API, built once per key. Treat as read-only."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
 
-    Args:
-        news_data: Processed news pipeline output.
-        temperature: OpenAI sampling temperature. Default 0.1 for primary pass.
-            Confirmation pass uses 0.4 to test score robustness.
+
+# Every overnight desk runs this same analysis on the same poke with the same
+# news, so successful results are shared for a few minutes. Temperature is part
+# of the key: the confirmation pass (temp=0.4) still gets its own OpenAI call.
+GPT_CACHE_TTL_SECONDS = 300
+GPT_CACHE_MAX_ENTRIES = 32
+_GPT_CACHE = OrderedDict()
+_GPT_CACHE_LOCK = threading.Lock()
+
+
+def _gpt_cache_key(news_data, current_time_str, model, temperature):
+    """Key on everything that varies in the prompt: the news and the CURRENT TIME line.
+
+    The time is minute-resolution, so desks poked together share one call
+    while a later poke with unchanged news still gets a fresh analysis.
     """
+    digest = hashlib.md5(news_data['summary'].encode('utf-8')).hexdigest()
+    return (digest, news_data['count'], current_time_str, model, temperature)
 
-    if news_data['count'] == 0:
-        print("\n[LAYER 3] GPT ANALYSIS: Skipped (no news) — defaulting to ELEVATED")
-        return {
-            'score': 7,
-            'raw_score': 7,
-            'category': 'ELEVATED',
-            'reasoning': 'No actionable news available - defaulting to elevated risk (no data = caution)',
-            'direction_risk': 'UNKNOWN',
-            'key_risk': 'None',
-            'duplicates_found': 'None',
-            'token_usage': {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
-        }
 
-    config = get_config()
-    openai_api_key = config.get('OPENAI_API_KEY')
-    openai_model = (config.get('OPENAI_MODEL') or '').strip() or 'gpt-4o-mini'
+def _gpt_cache_get(key):
+    """Return a private copy of a fresh cached result, or None."""
+    with _GPT_CACHE_LOCK:
+        entry = _GPT_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time_module.monotonic() - stored_at >= GPT_CACHE_TTL_SECONDS:
+            del _GPT_CACHE[key]
+            return None
+        _GPT_CACHE.move_to_end(key)
+    # Callers adjust the returned dict (earnings modifier), so never hand out the cached one.
+    result = copy.deepcopy(result)
+    result['token_usage'] = {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
+    return result
 
-    now = datetime.now(ET_TZ)
-    current_time_str = now.strftime("%I:%M %p ET")
 
-    prompt = f"""You are an expert overnight volatility risk analyst for SPX iron condor positions.
+def _gpt_cache_put(key, result):
+    with _GPT_CACHE_LOCK:
+        _GPT_CACHE[key] = (time_module.monotonic(), copy.deepcopy(result))
+        _GPT_CACHE.move_to_end(key)
+        while len(_GPT_CACHE) > GPT_CACHE_MAX_ENTRIES:
+            _GPT_CACHE.popitem(last=False)
+
 
-CURRENT TIME: {current_time_str}
+# The prompt is ~8KB of fixed text around two values (current time and the news
+# summary); the fixed parts are built once here and concatenated per call.
+_GPT_PROMPT_HEAD = """You are an expert overnight volatility risk analyst for SPX iron condor positions.
+
+CURRENT TIME: """
+
+_GPT_PROMPT_MIDDLE = """
 
 CONTEXT:
 - Selling SPX iron condor NOW (1:30-2:30 PM ET entry)
@@ -195,7 +231,9 @@ Example E: Multiple Mag 7 stocks down 2-3% intraday (ongoing trend)
 Remember: Mag 7 = 30% of SPX weight. Their news has DIRECT SPX impact.
 
 NEWS (may contain duplicates/commentary - YOU filter and classify):
-{news_data['summary']}
+"""
+
+_GPT_PROMPT_TAIL = """
 
 YOUR ANALYSIS PROCESS:
 
@@ -225,122 +263,165 @@ In your reasoning, EXPLICITLY mention:
 - Why those events create overnight risk (or don't)
 
 Respond in JSON only (no markdown):
-{{
+{
   "overnight_magnitude_risk_score": 1-10,
   "risk_category": "VERY_QUIET/QUIET/MODERATE/ELEVATED/EXTREME",
   "reasoning": "MUST mention: (1) Duplicates found, (2) Commentary filtered, (3) Unique events with SIGNIFICANCE + TIME + % PRICED IN analysis",
   "key_overnight_risk": "Single most important unique catalyst with significance level, or 'None - mostly commentary/duplicates'",
   "direction_risk": "UP/DOWN/BOTH/NONE",
   "duplicates_found": "List any duplicate articles (same event from multiple sources), or 'None'"
-}}
+}
 """
 
-    temp_label = f", temp={temperature}" if temperature != 0.1 else ""
-    print(f"\n[LAYER 3] GPT ANALYSIS: Calling OpenAI ({openai_model}{temp_label}) with significance-time decay model...")
-
-    try:
-        headers = {
-            "Authorization": f"Bearer {openai_api_key}",
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": openai_model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 1000,
-            "temperature": temperature
-        }
 
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=60
-        )
+def _post_chat_completion(prompt, openai_model, temperature, openai_api_key):
+    """POST the prompt to OpenAI chat completions. Raises requests.RequestException."""
+    data = {
+        "model": openai_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 1000,
+        "temperature": temperature,
+        # JSON mode: the reply is always a bare JSON object (no markdown fences)
+        "response_format": {"type": "json_object"},
+    }
+    return SESSION.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers=_openai_headers(openai_api_key),
+        json=data,
+        timeout=60
+    )
+
+
+def _elevated_fallback(reasoning, key_risk):
+    """Default ELEVATED result when OpenAI gives no usable analysis (no analysis = caution)."""
+    return {
+        'score': 7,
+        'raw_score': 7,
+        'category': 'ELEVATED',
+        'reasoning': reasoning,
+        'direction_risk': 'UNKNOWN',
+        'key_risk': key_risk,
+        'duplicates_found': 'Error',
+        'token_usage': {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
+    }
+
+
+def analyze_gpt_news(news_data, temperature=0.1, now=None):
+    """LAYER 3: GPT analysis with significance-based time decay model.
 
-        if response.status_code != 200:
-            print(f"  ❌ OpenAI API error: {response.status_code} — defaulting to ELEVATED")
-            return {
-                'score': 7,
-                'raw_score': 7,
-                'category': 'ELEVATED',
-                'reasoning': f'API error: {response.status_code} — defaulting to elevated risk (no analysis = caution)',
-                'direction_risk': 'UNKNOWN',
-                'key_risk': 'API Error — no analysis performed',
-                'duplicates_found': 'Error',
-                'token_usage': {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
-            }
-
-        result = response.json()
-
-        # Extract token usage
-        usage = result.get('usage', {})
-        input_tokens = usage.get('prompt_tokens', 0)
-        output_tokens = usage.get('completion_tokens', 0)
-        total_tokens = usage.get('total_tokens', 0)
+    Args:
+        news_data: Processed news pipeline output.
+        temperature: OpenAI sampling temperature. Default 0.1 for primary pass.
+            Confirmation pass uses 0.4 to test score robustness.
+        now: ET-aware time of the signal cycle, shown to GPT as CURRENT TIME.
+            Defaults to the current time.
+    """
 
-        # Cost estimate (gpt-4o-mini: $0.15/1M input, $0.60/1M output)
-        total_cost = (input_tokens * 0.15 / 1_000_000) + (output_tokens * 0.60 / 1_000_000)
+    if news_data['count'] == 0:
+        print("\n[LAYER 3] GPT ANALYSIS: Skipped (no news) — defaulting to ELEVATED")
+        return {
+            'score': 7,
+            'raw_score': 7,
+            'category': 'ELEVATED',
+            'reasoning': 'No actionable news available - defaulting to elevated risk (no data = caution)',
+            'direction_risk': 'UNKNOWN',
+            'key_risk': 'None',
+            'duplicates_found': 'None',
+            'token_usage': {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
+        }
 
-        print(f"  📊 TOKEN USAGE:")
-        print(f"     Input tokens:  {input_tokens:,}")
-        print(f"     Output tokens: {output_tokens:,}")
-        print(f"     Total tokens:  {total_tokens:,}")
-        print(f"     Est. cost:     ${total_cost:.4f}")
+    config = get_config()
+    openai_api_key = config.get('OPENAI_API_KEY')
+    openai_model = (config.get('OPENAI_MODEL') or '').strip() or 'gpt-4o-mini'
 
-        response_text = result['choices'][0]['message']['content'].strip()
+    if now is None:
+        now = datetime.now(ET_TZ)
+    current_time_str = now.strftime("%I:%M %p ET")
 
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
+    cache_key = _gpt_cache_key(news_data, current_time_str, openai_model, temperature)
+    cached = _gpt_cache_get(cache_key)
+    if cached is not None:
+        print(f"\n[LAYER 3] GPT ANALYSIS: Reusing analysis of the identical prompt from the last "
+              f"{GPT_CACHE_TTL_SECONDS // 60} min (temp={temperature}) — score {cached['score']}")
+        return cached
 
-        gpt_analysis = json.loads(response_text)
-        raw_score = gpt_analysis.get('overnight_magnitude_risk_score', 5)
-        raw_score = max(1, min(10, raw_score))
+    prompt = _GPT_PROMPT_HEAD + current_time_str + _GPT_PROMPT_MIDDLE + news_data['summary'] + _GPT_PROMPT_TAIL
 
-        # Calibration (less aggressive now since GPT has better framework)
-        if raw_score >= 9:
-            calibrated = raw_score
-        elif raw_score >= 7:
-            calibrated = raw_score - 0.5
-        elif raw_score <= 3:
-            calibrated = raw_score + 0.5
-        else:
-            calibrated = raw_score
+    temp_label = f", temp={temperature}" if temperature != 0.1 else ""
+    print(f"\n[LAYER 3] GPT ANALYSIS: Calling OpenAI ({openai_model}{temp_label}) with significance-time decay model...")
 
-        calibrated = max(1, min(10, round(calibrated)))
+    try:
+        response = _post_chat_completion(prompt, openai_model, temperature, openai_api_key)
 
-        print(f"  ✅ GPT Risk Score: {raw_score} (calibrated: {calibrated})")
-        print(f"  ✅ Category: {gpt_analysis.get('risk_category', 'MODERATE')}")
+        if response.status_code != 200:
+            print(f"  ❌ OpenAI API error: {response.status_code} — defaulting to ELEVATED")
+            return _elevated_fallback(
+                f'API error: {response.status_code} — defaulting to elevated risk (no analysis = caution)',
+                'API Error — no analysis performed',
+            )
 
-        return {
-            'score': calibrated,
-            'raw_score': raw_score,
-            'category': gpt_analysis.get('risk_category', 'MODERATE'),
-            'reasoning': gpt_analysis.get('reasoning', ''),
-            'key_risk': gpt_analysis.get('key_overnight_risk', 'None'),
-            'direction_risk': gpt_analysis.get('direction_risk', 'UNKNOWN'),
-            'duplicates_found': gpt_analysis.get('duplicates_found', 'None'),
-            'token_usage': {
-                'input': input_tokens,
-                'output': output_tokens,
-                'total': total_tokens,
-                'cost': total_cost
-            }
-        }
+        result = json_body(response)
+        usage = result.get('usage') or {}
+        input_tokens = usage.get('prompt_tokens', 0)
+        output_tokens = usage.get('completion_tokens', 0)
+        total_tokens = usage.get('total_tokens', 0)
+        gpt_analysis = orjson.loads(result['choices'][0]['message']['content'])
+        raw_score = max(1, min(10, gpt_analysis.get('overnight_magnitude_risk_score', 5)))
 
+    except (requests.RequestException, ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+        # Expected failures (network, malformed JSON, unexpected response shape): no traceback
+        print(f"  ❌ OpenAI error: {e} — defaulting to ELEVATED")
+        return _elevated_fallback(
+            f'OpenAI error: {str(e)} — defaulting to elevated risk (no analysis = caution)',
+            'Error — no analysis performed',
+        )
     except Exception as e:
         print(f"  ❌ OpenAI error: {e} — defaulting to ELEVATED")
-        import traceback
         traceback.print_exc()
-        return {
-            'score': 7,
-            'raw_score': 7,
-            'category': 'ELEVATED',
-            'reasoning': f'OpenAI error: {str(e)} — defaulting to elevated risk (no analysis = caution)',
-            'direction_risk': 'UNKNOWN',
-            'key_risk': 'Error — no analysis performed',
-            'duplicates_found': 'Error',
-            'token_usage': {'input': 0, 'output': 0, 'total': 0, 'cost': 0.0}
+        return _elevated_fallback(
+            f'OpenAI error: {str(e)} — defaulting to elevated risk (no analysis = caution)',
+            'Error — no analysis performed',
+        )
+
+    # Cost estimate (gpt-4o-mini: $0.15/1M input, $0.60/1M output)
+    total_cost = (input_tokens * 0.15 / 1_000_000) + (output_tokens * 0.60 / 1_000_000)
+
+    # Calibration (less aggressive now since GPT has better framework)
+    if raw_score >= 9:
+        calibrated = raw_score
+    elif raw_score >= 7:
+        calibrated = raw_score - 0.5
+    elif raw_score <= 3:
+        calibrated = raw_score + 0.5
+    else:
+        calibrated = raw_score
+
+    calibrated = max(1, min(10, round(calibrated)))
+
+    # One print for the result block: the confirmation pass runs concurrently,
+    # so its lines must not interleave with these.
+    print(f"  📊 TOKEN USAGE (temp={temperature}):\n"
+          f"     Input tokens:  {input_tokens:,}\n"
+          f"     Output tokens: {output_tokens:,}\n"
+          f"     Total tokens:  {total_tokens:,}\n"
+          f"     Est. cost:     ${total_cost:.4f}\n"
+          f"  ✅ GPT Risk Score: {raw_score} (calibrated: {calibrated})\n"
+          f"  ✅ Category: {gpt_analysis.get('risk_category', 'MODERATE')}")
+
+    analysis = {
+        'score': calibrated,
+        'raw_score': raw_score,
+        'category': gpt_analysis.get('risk_category', 'MODERATE'),
+        'reasoning': gpt_analysis.get('reasoning', ''),
+        'key_risk': gpt_analysis.get('key_overnight_risk', 'None'),
+        'direction_risk': gpt_analysis.get('direction_risk', 'UNKNOWN'),
+        'duplicates_found': gpt_analysis.get('duplicates_found', 'None'),
+        'token_usage': {
+            'input': input_tokens,
+            'output': output_tokens,
+            'total': total_tokens,
+            'cost': total_cost
         }
+    }
+    _gpt_cache_put(cache_key, analysis)
+    return analysis
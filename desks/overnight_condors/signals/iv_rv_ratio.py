@@ -1,5 +1,22 @@
 """Indicator 1: IV/RV Ratio Analysis (30% weight)"""
 import math
+from bisect import bisect_left
+
+import numpy as np
+
+# Daily std -> annualized vol in percent (252 trading days)
+_ANNUALIZE_PCT = math.sqrt(252) * 100
+
+# IV/RV base score: ratio strictly above each threshold steps down one score.
+# bisect_left keeps the boundaries exclusive (a ratio of exactly 1.35 scores 2).
+_IVRV_THRESHOLDS = (0.80, 0.90, 1.00, 1.10, 1.20, 1.35)
+_IVRV_SCORES = (10, 8, 6, 4, 3, 2, 1)
+
+
+def _realized_vol(closes):
+    """Annualized close-to-close realized vol (%) from a DESC-ordered close window."""
+    log_returns = np.diff(np.log(np.asarray(closes, dtype=np.float64)))
+    return float(log_returns.std(ddof=1) * _ANNUALIZE_PCT)
 
 
 def analyze_iv_rv_ratio(spx_data, vix1d_data, vix_data=None, vvix_data=None):
@@ -17,16 +34,7 @@ def analyze_iv_rv_ratio(spx_data, vix1d_data, vix_data=None, vvix_data=None):
     # Calculate 10-day Realized Volatility
     closes = spx_data['history_closes'][:11]  # Need 11 days to get 10 returns
 
-    returns = []
-    for i in range(1, len(closes)):
-        daily_return = math.log(closes[i] / closes[i-1])
-        returns.append(daily_return)
-
-    mean_return = sum(returns) / len(returns)
-    squared_diffs = [(r - mean_return)**2 for r in returns]
-    variance = sum(squared_diffs) / (len(returns) - 1)
-    daily_std = math.sqrt(variance)
-    realized_vol = daily_std * math.sqrt(252) * 100
+    realized_vol = _realized_vol(closes)
 
     # VIX1D = 1-day forward implied volatility (already in percentage terms)
     implied_vol = vix1d_data['current']
@@ -35,31 +43,12 @@ def analyze_iv_rv_ratio(spx_data, vix1d_data, vix_data=None, vvix_data=None):
     iv_rv_ratio = implied_vol / realized_vol
 
     # Scoring logic
-    if iv_rv_ratio > 1.35:
-        base_score = 1
-    elif iv_rv_ratio > 1.20:
-        base_score = 2
-    elif iv_rv_ratio > 1.10:
-        base_score = 3
-    elif iv_rv_ratio > 1.00:
-        base_score = 4
-    elif iv_rv_ratio > 0.90:
-        base_score = 6
-    elif iv_rv_ratio > 0.80:
-        base_score = 8
-    else:
-        base_score = 10
+    base_score = _IVRV_SCORES[bisect_left(_IVRV_THRESHOLDS, iv_rv_ratio)]
 
     # RV change modifier
     if len(spx_data['history_closes']) >= 21:
         closes_earlier = spx_data['history_closes'][11:22]
-        returns_earlier = []
-        for i in range(1, len(closes_earlier)):
-            returns_earlier.append(math.log(closes_earlier[i] / closes_earlier[i-1]))
-
-        mean_earlier = sum(returns_earlier) / len(returns_earlier)
-        variance_earlier = sum([(r - mean_earlier)**2 for r in returns_earlier]) / (len(returns_earlier) - 1)
-        rv_earlier = math.sqrt(variance_earlier) * math.sqrt(252) * 100
+        rv_earlier = _realized_vol(closes_earlier)
 
         rv_change = (realized_vol - rv_earlier) / rv_earlier if rv_earlier > 0 else 0
 
@@ -114,17 +103,16 @@ def analyze_iv_rv_ratio(spx_data, vix1d_data, vix_data=None, vvix_data=None):
     # Overnight RV: std(log(open_t / close_{t-1})) * sqrt(252) * 100
     history_opens = spx_data.get('history_opens')
     if history_opens and len(history_opens) >= 10 and len(closes) >= 10:
-        overnight_returns = []
-        for i in range(min(len(history_opens[:10]), len(closes[:10])) - 1):
-            # opens[i] is the open of day i, closes[i+1] is the close of the previous day
-            # (data is in DESC order: most recent first)
-            if closes[i + 1] > 0:
-                overnight_returns.append(math.log(history_opens[i] / closes[i + 1]))
+        # opens[i] is the open of day i, closes[i+1] is the close of the previous day
+        # (data is in DESC order: most recent first)
+        opens = np.asarray(history_opens[:9], dtype=np.float64)
+        prev_closes = np.asarray(closes[1:10], dtype=np.float64)
+        valid = prev_closes > 0
+        overnight_returns = np.log(opens[valid] / prev_closes[valid])
 
         if len(overnight_returns) >= 5:
-            on_mean = sum(overnight_returns) / len(overnight_returns)
-            on_var = sum((r - on_mean) ** 2 for r in overnight_returns) / (len(overnight_returns) - 1)
-            overnight_rv = math.sqrt(on_var) * math.sqrt(252) * 100
+            on_var = float(overnight_returns.var(ddof=1))
+            overnight_rv = math.sqrt(on_var) * _ANNUALIZE_PCT
 
             result['overnight_rv'] = round(overnight_rv, 2)
             result['iv_overnight_rv_ratio'] = round(implied_vol / overnight_rv, 3) if overnight_rv > 0 else None
@@ -1,4 +1,11 @@
 """Indicator 2: Market Trend Analysis (20% weight)"""
+from bisect import bisect_left
+
+# Score tables: a value strictly above each threshold moves to the next entry.
+_CHANGE_5D_THRESHOLDS = (0.01, 0.02, 0.04)
+_CHANGE_5D_SCORES = (1, 2, 4, 7)
+_INTRADAY_RANGE_THRESHOLDS = (0.010, 0.015)
+_INTRADAY_RANGE_MODIFIERS = (0, +1, +2)
 
 
 def analyze_market_trend(spx_data):
@@ -14,25 +21,13 @@ def analyze_market_trend(spx_data):
     change_5d = (current - spx_5d_ago) / spx_5d_ago
     abs_change = abs(change_5d)
 
-    if abs_change > 0.04:
-        base_score = 7
-    elif abs_change > 0.02:
-        base_score = 4
-    elif abs_change > 0.01:
-        base_score = 2
-    else:
-        base_score = 1
+    base_score = _CHANGE_5D_SCORES[bisect_left(_CHANGE_5D_THRESHOLDS, abs_change)]
     
     high = spx_data['high_today']
     low = spx_data['low_today']
     intraday_range = (high - low) / current
     
-    if intraday_range > 0.015:
-        modifier = +2
-    elif intraday_range > 0.010:
-        modifier = +1
-    else:
-        modifier = 0
+    modifier = _INTRADAY_RANGE_MODIFIERS[bisect_left(_INTRADAY_RANGE_THRESHOLDS, intraday_range)]
     
     final_score = max(1, min(10, base_score + modifier))
     
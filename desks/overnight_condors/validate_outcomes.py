@@ -54,10 +54,10 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
-import requests
 import pytz
 
 from core.config import get_config
+from core.http import SESSION, json_body
 
 logger = logging.getLogger(__name__)
 ET_TZ = pytz.timezone('US/Eastern')
@@ -311,12 +311,12 @@ def _fetch_spx_day(date_str: str, api_key: str, max_holiday_retries: int = 5
                 f"https://api.massive.com/v2/aggs/ticker/I:SPX/range/1/day/"
                 f"{ds}/{ds}?adjusted=true&sort=asc&limit=1&apiKey={api_key}"
             )
-            resp = requests.get(url, timeout=15)
+            resp = SESSION.get(url, timeout=15)
             if resp.status_code != 200:
                 print(f"  [Polygon] HTTP {resp.status_code} for {ds}")
                 return None
 
-            data = resp.json()
+            data = json_body(resp)
             results = data.get('results', [])
             if not results:
                 print(f"  [Polygon] No data for {ds} (holiday?), trying next weekday...")
@@ -349,11 +349,11 @@ def _fetch_spx_10am_price(date_str: str, api_key: str) -> Optional[float]:
             f"https://api.massive.com/v2/aggs/ticker/I:SPX/range/1/minute/"
             f"{date_str}/{date_str}?adjusted=true&sort=asc&limit=500&apiKey={api_key}"
         )
-        resp = requests.get(url, timeout=15)
+        resp = SESSION.get(url, timeout=15)
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = json_body(resp)
         results = data.get('results', [])
         if not results:
             return None
@@ -0,0 +1,123 @@
+"""Flask app test suite.
+
+Pins ORJSONProvider's jsonify() output to Flask's DefaultJSONProvider, which
+its response() override mirrors through Flask internals, and checks the
+/test_polygon_delayed probe cache — no network.
+
+Run: python -m pytest tests/test_app.py -v
+"""
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+import app as app_module
+from app import ORJSONProvider
+
+
+_PAYLOAD = {
+    'signal': 'TRADE_NORMAL',
+    'composite': 4.25,
+    'factors': {'gpt': {'score': 3}, 'iv_rv': {'score': 5}},
+    'headlines': ['Fed holds rates', 'CPI in line'],
+    'empty': [],
+    'as_of': date(2026, 3, 2),
+    'notional': Decimal('1.50'),
+}
+
+
+def _providers(compact=None, debug=False, sort_keys=True):
+    providers = []
+    for cls in (DefaultJSONProvider, ORJSONProvider):
+        app = Flask(__name__)
+        app.debug = debug
+        provider = cls(app)
+        provider.compact = compact
+        provider.sort_keys = sort_keys
+        providers.append((app, provider))
+    return providers
+
+
+# ── Response Parity ─────────────────────────────────────────────────────
+
+
+class TestResponseMatchesFlask:
+    """ASCII payloads render byte-for-byte as Flask's own provider would."""
+
+    @pytest.mark.parametrize('compact,debug', [(None, False), (None, True), (True, True), (False, False)])
+    def test_body_and_mimetype(self, compact, debug):
+        (flask_app, flask_json), (orjson_app, orjson_json) = _providers(compact, debug)
+        with flask_app.app_context():
+            expected = flask_json.response(_PAYLOAD)
+        with orjson_app.app_context():
+            actual = orjson_json.response(_PAYLOAD)
+        assert actual.get_data() == expected.get_data()
+        assert actual.mimetype == expected.mimetype
+
+    @pytest.mark.parametrize('args,kwargs', [((1, 2), {}), ((), {'a': 1}), ((), {}), (([1, 2],), {})])
+    def test_argument_forms(self, args, kwargs):
+        (flask_app, flask_json), (orjson_app, orjson_json) = _providers()
+        with flask_app.app_context():
+            expected = flask_json.response(*args, **kwargs)
+        with orjson_app.app_context():
+            actual = orjson_json.response(*args, **kwargs)
+        assert actual.get_data() == expected.get_data()
+
+    def test_sort_keys_honored(self):
+        _, (orjson_app, orjson_json) = _providers(sort_keys=False)
+        with orjson_app.app_context():
+            body = orjson_json.response({'b': 1, 'a': 2}).get_data()
+        assert body == b'{"b":1,"a":2}\n'
+
+    def test_non_ascii_written_as_utf8(self):
+        """Unlike Flask's ensure_ascii default, text is raw UTF-8; it decodes the same."""
+        (flask_app, flask_json), (orjson_app, orjson_json) = _providers()
+        payload = {'headline': '“Fed” holds 📉'}
+        with flask_app.app_context():
+            expected = flask_json.response(payload).get_data()
+        with orjson_app.app_context():
+            actual = orjson_json.response(payload).get_data()
+        assert actual == '{"headline":"“Fed” holds 📉"}\n'.encode('utf-8')
+        assert orjson.loads(actual) == orjson.loads(expected)
+
+
+# ── Polygon Probe Cache ─────────────────────────────────────────────────
+
+
+class TestPolygonProbeCache:
+    """Repeat probes within the TTL reuse the last READY run."""
+
+    @pytest.fixture
+    def probes(self, monkeypatch):
+        runs = []
+        status = ['READY']
+
+        def fake_run():
+            runs.append(1)
+            return {'status': status[0], 'spx_snapshot': {'status': 'SUCCESS'}}
+
+        monkeypatch.setattr(app_module, '_run_polygon_probes', fake_run)
+        monkeypatch.setattr(app_module, 'POLYGON_API_KEY', 'test')
+        monkeypatch.setattr(app_module, '_polygon_probe_cache', (None, None))
+        return runs, status
+
+    def _get(self):
+        return app_module.app.test_client().get('/test_polygon_delayed').get_json()
+
+    def test_repeat_probe_served_from_cache(self, probes):
+        runs, _ = probes
+        first, second = self._get(), self._get()
+        assert len(runs) == 1
+        assert first['cached'] is False and second['cached'] is True
+        assert second['status'] == 'READY'
+        assert 'test_time' in second and 'probe_age_seconds' in second
+
+    def test_partial_run_not_cached(self, probes):
+        runs, status = probes
+        status[0] = 'PARTIAL'
+        self._get()
+        assert self._get()['cached'] is False
+        assert len(runs) == 2
@@ -0,0 +1,82 @@
+"""Shared HTTP session test suite.
+
+Checks the adapter's retry policy against a local server — no network.
+
+Run: python -m pytest tests/test_http.py -v
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from core.http import SESSION
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(429)
+        self.send_header('Retry-After', '30')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class _StallingHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(2)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(handler):
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def stalling_url():
+    server = _serve(_StallingHandler)
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def rate_limited_url():
+    _RateLimitedHandler.hits = 0
+    server = _serve(_RateLimitedHandler)
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+# ── Retry Policy ────────────────────────────────────────────────────────
+
+
+class TestRetryPolicy:
+    """Only connection failures are retried; server responses come straight back."""
+
+    def test_429_returned_without_retry(self, rate_limited_url):
+        response = SESSION.get(rate_limited_url, timeout=5)
+        assert response.status_code == 429
+        assert _RateLimitedHandler.hits == 1
+
+    def test_status_retries_disabled(self):
+        retry = SESSION.get_adapter('https://example.com').max_retries
+        for status in (413, 429, 503):
+            assert not retry.is_retry('GET', status, has_retry_after=True)
+
+    def test_read_timeout_keeps_its_type(self, stalling_url):
+        """A read timeout surfaces as ReadTimeout, not a wrapped ConnectionError."""
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            SESSION.get(stalling_url, timeout=0.5)
@@ -0,0 +1,177 @@
+"""Market data test suite.
+
+Exercises the Polygon fetchers against a stubbed HTTP session — no network.
+
+Run: python -m pytest tests/test_market_data.py -v
+"""
+import orjson
+import pytest
+
+import core.data.market_data as market_data
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    @property
+    def content(self):
+        return orjson.dumps(self._payload)
+
+
+def _snapshot_payload(ticker, value):
+    return {'results': [{
+        'ticker': ticker,
+        'value': value,
+        'session': {'high': value + 10, 'low': value - 10},
+        'timeframe': 'DELAYED',
+        'market_status': 'open',
+    }]}
+
+
+@pytest.fixture
+def polygon(monkeypatch):
+    """Stub config + HTTP; returns the list of requested URLs."""
+    calls = []
+    payloads = {
+        'I:SPX': _snapshot_payload('I:SPX', 5800.0),
+        'I:VIX1D': _snapshot_payload('I:VIX1D', 12.5),
+    }
+    aggs_payload = {'results': [{'c': 5800.0 - i, 'o': 5795.0 - i} for i in range(30)]}
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        if '/v2/aggs/ticker/I:SPX/' in url:
+            return _FakeResponse(aggs_payload)
+        for ticker, payload in payloads.items():
+            if f'ticker.any_of={ticker}&' in url:
+                return _FakeResponse(payload)
+        return _FakeResponse({}, status_code=500)
+
+    monkeypatch.setattr(market_data, 'get_config', lambda: {'POLYGON_API_KEY': 'test'})
+    monkeypatch.setattr(market_data.SESSION, 'get', fake_get)
+    market_data._SNAPSHOT_CACHE.clear()
+    yield calls
+    market_data._SNAPSHOT_CACHE.clear()
+
+
+# ── Snapshot TTL Cache ──────────────────────────────────────────────────
+
+
+class TestSnapshotCache:
+    """Repeated snapshot reads within the TTL share one Polygon fetch."""
+
+    def test_second_call_served_from_cache(self, polygon):
+        first = market_data.get_spx_snapshot()
+        second = market_data.get_spx_snapshot()
+        assert first['current'] == 5800.0
+        assert second is first
+        assert len(polygon) == 1
+
+    def test_cache_is_per_ticker(self, polygon):
+        market_data.get_spx_snapshot()
+        vix1d = market_data.get_vix1d_snapshot()
+        assert vix1d['current'] == 12.5
+        assert len(polygon) == 2
+
+    def test_expired_entry_refetched(self, polygon, monkeypatch):
+        market_data.get_spx_snapshot()
+        monkeypatch.setattr(market_data, 'SNAPSHOT_TTL_SECONDS', 0)
+        market_data.get_spx_snapshot()
+        assert len(polygon) == 2
+
+    def test_failures_not_cached(self, polygon):
+        assert market_data.get_vix_snapshot() is None
+        assert market_data.get_vix_snapshot() is None
+        assert len(polygon) == 2
+
+    def test_spx_aggregates_cached_separately(self, polygon):
+        first = market_data.get_spx_aggregates()
+        second = market_data.get_spx_aggregates()
+        assert len(first['closes']) == 25
+        assert second is first
+        market_data.get_spx_snapshot()
+        assert len(polygon) == 2
+
+    def test_wrapped_fetcher_bypasses_cache(self, polygon):
+        """/test_polygon_delayed probes through __wrapped__ to always reach Polygon."""
+        market_data.get_spx_snapshot()
+        market_data.get_spx_snapshot.__wrapped__()
+        market_data.get_spx_aggregates()
+        market_data.get_spx_aggregates.__wrapped__()
+        assert len(polygon) == 4
+
+
+# ── Batched Snapshot Prefetch ───────────────────────────────────────────
+
+
+class TestSnapshotPrefetch:
+    """One ticker.any_of call fills the cache for every index it returns."""
+
+    @pytest.fixture
+    def batch(self, monkeypatch):
+        calls = []
+        payload = {'results': (_snapshot_payload('I:SPX', 5800.0)['results']
+                               + _snapshot_payload('I:VIX1D', 12.5)['results']
+                               + [{'ticker': 'I:VVIX', 'error': 'NOT_ENTITLED'}])}
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            if 'ticker.any_of=I:SPX,I:VIX1D,I:VVIX&' in url:
+                return _FakeResponse(payload)
+            return _FakeResponse({}, status_code=500)
+
+        monkeypatch.setattr(market_data, 'get_config', lambda: {'POLYGON_API_KEY': 'test'})
+        monkeypatch.setattr(market_data.SESSION, 'get', fake_get)
+        market_data._SNAPSHOT_CACHE.clear()
+        yield calls
+        market_data._SNAPSHOT_CACHE.clear()
+
+    def test_prefetched_snapshots_served_from_cache(self, batch):
+        market_data.prefetch_index_snapshots(('I:SPX', 'I:VIX1D', 'I:VVIX'))
+        assert market_data.get_spx_snapshot()['current'] == 5800.0
+        assert market_data.get_vix1d_snapshot()['current'] == 12.5
+        assert len(batch) == 1
+
+    def test_errored_ticker_left_to_its_own_fetch(self, batch):
+        market_data.prefetch_index_snapshots(('I:SPX', 'I:VIX1D', 'I:VVIX'))
+        assert 'I:VVIX' not in market_data._SNAPSHOT_CACHE
+        assert market_data.get_vvix_snapshot() is None
+        assert len(batch) == 2
+
+    def test_cached_tickers_not_refetched(self, batch):
+        market_data.prefetch_index_snapshots(('I:SPX', 'I:VIX1D', 'I:VVIX'))
+        market_data.prefetch_index_snapshots(('I:SPX', 'I:VIX1D'))
+        assert len(batch) == 1
+
+
+# ── VVIX Percentile ─────────────────────────────────────────────────────
+
+
+class TestVvixPercentile:
+    """Percentile rank over the cached 252-day VVIX window."""
+
+    def test_mid_rank_ties(self):
+        values = [80.0, 90.0, 90.0, 100.0]
+        assert market_data._percentile_rank(90.0, values) == 50.0
+        assert market_data._percentile_rank(70.0, values) == 0.0
+        assert market_data._percentile_rank(110.0, values) == 100.0
+        assert market_data._percentile_rank(90.0, []) is None
+
+    def test_uses_cached_sorted_history(self, monkeypatch):
+        closes = [float(v) for v in range(160, 60, -1)]   # 100 bars, descending
+        monkeypatch.setattr(market_data, 'get_vvix_aggregates', lambda lookback_calendar_days: closes)
+        monkeypatch.setattr(market_data, '_VVIX_HISTORY_CACHE', (None, [], []))
+        assert market_data.vvix_percentile_252d(110.5) == 50.0
+        assert market_data._VVIX_HISTORY_CACHE[2] == sorted(closes)
+        assert market_data.vvix_percentile_bucket(110.5) == ('HIGH', 50.0, 100, 'percentile_252d')
+
+    def test_stale_day_replaced_as_one_entry(self, monkeypatch):
+        closes = [float(v) for v in range(60, 160)]
+        monkeypatch.setattr(market_data, 'get_vvix_aggregates', lambda lookback_calendar_days: closes)
+        monkeypatch.setattr(market_data, '_VVIX_HISTORY_CACHE', ('2000-01-03', [1.0] * 100, [1.0] * 100))
+        assert market_data.get_vvix_252d_history() is closes
+        date, cached, sorted_closes = market_data._VVIX_HISTORY_CACHE
+        assert date != '2000-01-03'
+        assert cached is closes and sorted_closes == sorted(closes)
@@ -0,0 +1,274 @@
+"""News processing test suite.
+
+Covers RSS date parsing and conditional GETs, Layer 1 deduplication, Layer 2
+keyword filtering and the pipeline that formats the result for GPT.
+
+Run: python -m pytest tests/test_news_processing.py -v
+"""
+import io
+from datetime import datetime
+
+import pytest
+import pytz
+
+import core.data.news_fetcher as news_fetcher
+from core.data.news_fetcher import _parse_pubdate
+from core.processing.news_dedup import (
+    deduplicate_articles_smart,
+    get_source_priority,
+    normalize_title,
+    titles_are_similar,
+)
+from core.processing.news_filter import (
+    classify_priority,
+    filter_news_lenient,
+    is_obvious_junk,
+)
+from core.processing.pipeline import process_news_pipeline
+
+ET_TZ = pytz.timezone('US/Eastern')
+
+
+def _make_article(title, source='Yahoo Finance - Market', hour=13, minute=0):
+    """Build a minimal raw article dict for testing."""
+    return {
+        'title': title,
+        'source': source,
+        'description': '',
+        'published_time': ET_TZ.localize(datetime(2026, 3, 2, hour, minute)),
+        'hours_ago': 1.0,
+    }
+
+
+# ── Layer 1: Deduplication ──────────────────────────────────────────────
+
+
+class TestDeduplication:
+    """Verify fuzzy dedup keeps one copy of each story."""
+
+    def test_normalize_title(self):
+        assert normalize_title("  Apple Beats Q4 Earnings!  ") == "apple beats q4 earnings"
+
+    def test_similar_titles(self):
+        assert titles_are_similar("Apple beats Q4 earnings", "Apple beats Q4 earnings!")
+        assert not titles_are_similar("Apple beats Q4 earnings", "Fed holds rates steady")
+
+    def test_prefilters_agree_with_full_ratio(self):
+        """Length/quick-ratio gates must never reject a pair the full ratio accepts."""
+        from difflib import SequenceMatcher
+        pairs = [
+            ("Breaking: Apple beats Q4 earnings", "Apple beats Q4 earnings"),
+            ("Fed holds rates steady", "Fed holds rate steady"),
+            ("Nvidia soars", "Nvidia stock soars 8% after earnings beat"),
+            ("", ""),
+        ]
+        for a, b in pairs:
+            expected = SequenceMatcher(None, normalize_title(a), normalize_title(b)).ratio() >= 0.85
+            assert titles_are_similar(a, b) == expected
+
+    def test_exact_duplicates_removed(self):
+        articles = [
+            _make_article("Apple beats Q4 earnings"),
+            _make_article("apple beats q4 earnings", source='Google News'),
+        ]
+        assert len(deduplicate_articles_smart(articles)) == 1
+
+    def test_near_duplicates_removed(self):
+        articles = [
+            _make_article("Nvidia stock soars 8% after earnings beat"),
+            _make_article("Nvidia stock soars 8% after earnings beats"),
+        ]
+        assert len(deduplicate_articles_smart(articles)) == 1
+
+    def test_distinct_stories_kept(self):
+        articles = [
+            _make_article("Nvidia stock soars 8% after earnings beat"),
+            _make_article("Fed holds rates steady"),
+            _make_article("Tesla shares fall on delivery miss"),
+        ]
+        assert len(deduplicate_articles_smart(articles)) == 3
+
+    def test_most_recent_copy_kept(self):
+        older = _make_article("Apple beats Q4 earnings", hour=10)
+        newer = _make_article("Apple beats Q4 earnings!", hour=12)
+        unique = deduplicate_articles_smart([older, newer])
+        assert unique == [newer]
+
+    def test_source_priority_breaks_ties(self):
+        yahoo = _make_article("Apple beats Q4 earnings", source='Yahoo Finance - Apple')
+        google = _make_article("Apple beats Q4 earnings", source='Google News')
+        unique = deduplicate_articles_smart([yahoo, google])
+        assert unique == [google]
+
+    def test_source_priority_lookup(self):
+        assert get_source_priority('Yahoo Finance - Apple') == 4
+        assert get_source_priority('google news') == 3
+        assert get_source_priority('Google News - Reuters') == 1
+        assert get_source_priority('Some Blog') == 99
+
+    def test_length_mismatch_not_duplicate(self):
+        articles = [
+            _make_article("Apple beats"),
+            _make_article("Apple beats Q4 earnings forecast as iPhone sales surge"),
+        ]
+        assert len(deduplicate_articles_smart(articles)) == 2
+
+    def test_empty_input(self):
+        assert deduplicate_articles_smart([]) == []
+
+
+# ── Layer 2: Keyword Filter ─────────────────────────────────────────────
+
+
+class TestKeywordFilter:
+    """Verify junk patterns and priority tagging."""
+
+    def test_clickbait_is_junk(self):
+        assert is_obvious_junk("The secret to beating the market")
+        assert is_obvious_junk("5 ways to retire early")
+        assert is_obvious_junk("You won't believe what Tesla did")
+
+    def test_anchored_patterns_only_match_at_start(self):
+        assert is_obvious_junk("How to invest in 2026")
+        assert not is_obvious_junk("Analysts debate how to value Nvidia")
+
+    def test_news_is_not_junk(self):
+        assert not is_obvious_junk("Fed holds rates steady", "Powell signals patience")
+
+    def test_description_checked(self):
+        assert is_obvious_junk("Markets today", "A shocking move in bonds")
+
+    def test_high_priority(self):
+        assert classify_priority("Apple beats earnings expectations") == 'HIGH'
+        assert classify_priority("Nvidia stock soars 8% on guidance") == 'HIGH'
+        assert classify_priority("Tesla gets price target cut at Barclays") == 'HIGH'
+
+    def test_normal_priority(self):
+        assert classify_priority("Markets drift ahead of Fed minutes") == 'NORMAL'
+
+    def test_case_insensitive(self):
+        assert classify_priority("APPLE BEATS EARNINGS") == 'HIGH'
+        assert is_obvious_junk("SHOCKING market move")
+
+    def test_filter_news_lenient(self):
+        articles = [
+            _make_article("Apple beats earnings expectations"),
+            _make_article("The trick to picking stocks"),
+            _make_article("Fed holds rates steady"),
+        ]
+        filtered, stats = filter_news_lenient(articles)
+        assert stats == {'filtered_junk': 1, 'kept': 2}
+        assert [a['priority'] for a in filtered] == ['HIGH', 'NORMAL']
+
+
+# ── RSS pubDate Parsing ─────────────────────────────────────────────────
+
+
+class TestPubDateParsing:
+    """Verify RSS dates land in ET regardless of how the feed writes them."""
+
+    def test_rfc822_gmt(self):
+        parsed = _parse_pubdate("Mon, 02 Mar 2026 18:30:00 GMT")
+        assert parsed == ET_TZ.localize(datetime(2026, 3, 2, 13, 30))
+
+    def test_rfc822_unknown_offset_is_utc(self):
+        parsed = _parse_pubdate("Mon, 02 Mar 2026 18:30:00 -0000")
+        assert parsed == ET_TZ.localize(datetime(2026, 3, 2, 13, 30))
+
+    def test_rfc822_no_zone_is_et(self):
+        parsed = _parse_pubdate("Mon, 01 Jan 2024 10:00:00")
+        assert parsed == ET_TZ.localize(datetime(2024, 1, 1, 10, 0))
+
+    def test_non_rfc_falls_back(self):
+        parsed = _parse_pubdate("2026-03-02T18:30:00Z")
+        assert parsed == ET_TZ.localize(datetime(2026, 3, 2, 13, 30))
+
+    def test_garbage_returns_none(self):
+        assert _parse_pubdate("not a date") is None
+
+
+# ── RSS Conditional GET ─────────────────────────────────────────────────
+
+
+_FEED_XML = (b"<rss><channel><item><title>Fed holds rates steady</title>"
+             b"<pubDate>Mon, 02 Mar 2026 18:30:00 GMT</pubDate></item></channel></rss>")
+
+
+class _FakeRaw(io.BytesIO):
+    decode_content = False
+
+
+class _FakeFeedResponse:
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.raw = _FakeRaw(body)
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestFeedCache:
+    """Unchanged feeds are revalidated with a 304 instead of re-downloaded."""
+
+    URL = 'https://example.com/rss'
+
+    @pytest.fixture
+    def feed(self, monkeypatch):
+        """Serve _FEED_XML with an ETag; returns the request headers seen."""
+        seen = []
+
+        def fake_get(url, headers=None, **kwargs):
+            seen.append(dict(headers or {}))
+            if (headers or {}).get('If-None-Match') == '"v1"':
+                return _FakeFeedResponse(304)
+            return _FakeFeedResponse(200, _FEED_XML, {'ETag': '"v1"'})
+
+        monkeypatch.setattr(news_fetcher.SESSION, 'get', fake_get)
+        news_fetcher._FEED_CACHE.clear()
+        yield seen
+        news_fetcher._FEED_CACHE.clear()
+
+    def test_not_modified_reuses_parsed_items(self, feed):
+        first = news_fetcher.parse_rss_feed(self.URL, 'Test')
+        second = news_fetcher.parse_rss_feed(self.URL, 'Test')
+        assert feed == [{}, {'If-None-Match': '"v1"'}]
+        assert [a['title'] for a in second] == ['Fed holds rates steady']
+        assert second[0]['published_time'] == first[0]['published_time']
+
+    def test_articles_are_fresh_dicts(self, feed):
+        first = news_fetcher.parse_rss_feed(self.URL, 'Test')
+        first[0]['priority'] = 'HIGH'
+        assert 'priority' not in news_fetcher.parse_rss_feed(self.URL, 'Test')[0]
+
+    def test_feed_without_validators_not_cached(self, monkeypatch):
+        monkeypatch.setattr(news_fetcher.SESSION, 'get',
+                            lambda url, **kwargs: _FakeFeedResponse(200, _FEED_XML))
+        news_fetcher._FEED_CACHE.clear()
+        assert len(news_fetcher.parse_rss_feed(self.URL, 'Test')) == 1
+        assert self.URL not in news_fetcher._FEED_CACHE
+
+
+# ── Pipeline ────────────────────────────────────────────────────────────
+
+
+class TestPipeline:
+    """Verify the combined pipeline output used by the trigger routes."""
+
+    def test_display_time_formatted_once(self):
+        news = process_news_pipeline([_make_article("Fed holds rates steady", hour=13, minute=5)])
+        assert news['count'] == 1
+        assert news['articles'][0]['published_time_str'] == "01:05 PM"
+        assert "[01:05 PM]" in news['summary']
+
+    def test_empty_input(self):
+        news = process_news_pipeline([])
+        assert news['count'] == 0
+        assert news['articles'] == []
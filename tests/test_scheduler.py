@@ -0,0 +1,121 @@
+"""Poke scheduler test suite.
+
+Covers the deadline calculation that decides when the background thread
+next wakes and the end-of-window catch-up — no threads or HTTP.
+
+Run: python -m pytest tests/test_scheduler.py -v
+"""
+from datetime import datetime, time as dt_time
+
+import pytz
+
+import core.scheduler as scheduler
+from core.desk import Desk
+from core.scheduler import END_OF_WINDOW_CHECK, _next_daily, next_poke_slot, run_end_of_window_check_if_due
+
+ET_TZ = pytz.timezone('US/Eastern')
+
+
+class _OvernightDesk(Desk):
+    desk_id = 'overnight'
+
+
+class _ButterflyDesk(Desk):
+    desk_id = 'butterflies'
+    window_start = dt_time(13, 45)
+    window_end = dt_time(14, 15)
+    poke_minutes = [0, 10]
+
+
+def _et(day, hour, minute, second=0):
+    return ET_TZ.localize(datetime(2026, 3, day, hour, minute, second))
+
+
+# ── Poke Slots ──────────────────────────────────────────────────────────
+
+
+class TestNextPokeSlot:
+    """Verify the scheduler wakes exactly on each desk's poke minutes."""
+
+    def test_first_slot_of_the_day(self):
+        desk = _OvernightDesk()
+        slot, due = next_poke_slot([desk], _et(2, 9, 0))  # Monday morning
+        assert slot == _et(2, 13, 30)
+        assert due == [desk]
+
+    def test_slots_follow_poke_minutes(self):
+        desk = _OvernightDesk()
+        assert next_poke_slot([desk], _et(2, 13, 30))[0] == _et(2, 13, 50)
+        assert next_poke_slot([desk], _et(2, 13, 50, 5))[0] == _et(2, 14, 10)
+
+    def test_window_end_is_exclusive(self):
+        desk = _OvernightDesk()
+        slot, _ = next_poke_slot([desk], _et(2, 14, 10))
+        assert slot == _et(3, 13, 30)
+
+    def test_weekend_skipped(self):
+        desk = _OvernightDesk()
+        slot, _ = next_poke_slot([desk], _et(6, 15, 0))  # Friday afternoon
+        assert slot == _et(9, 13, 30)
+
+    def test_desks_sharing_a_slot_fire_together(self):
+        overnight, overnight_2, butterflies = _OvernightDesk(), _OvernightDesk(), _ButterflyDesk()
+        desks = [overnight, butterflies, overnight_2]
+        assert next_poke_slot(desks, _et(2, 13, 30)) == (_et(2, 13, 50), [overnight, overnight_2])
+        assert next_poke_slot(desks, _et(2, 13, 50)) == (_et(2, 14, 0), [butterflies])
+        slot, due = next_poke_slot(desks, _et(2, 14, 0))
+        assert slot == _et(2, 14, 10)
+        assert due == [overnight, butterflies, overnight_2]
+
+    def test_no_desks(self):
+        assert next_poke_slot([], _et(2, 9, 0)) == (None, [])
+
+
+# ── Daily Events ────────────────────────────────────────────────────────
+
+
+class TestNextDaily:
+    """Verify the end-of-window check and midnight reset deadlines."""
+
+    def test_later_today(self):
+        assert _next_daily(_et(2, 9, 0), END_OF_WINDOW_CHECK) == _et(2, 14, 31)
+
+    def test_rolls_to_tomorrow(self):
+        assert _next_daily(_et(2, 14, 31), END_OF_WINDOW_CHECK) == _et(3, 14, 31)
+
+    def test_weekdays_only(self):
+        assert _next_daily(_et(6, 15, 0), END_OF_WINDOW_CHECK, weekdays_only=True) == _et(9, 14, 31)
+
+
+# ── End-of-Window Check ─────────────────────────────────────────────────
+
+
+class TestEndOfWindowCheck:
+    """The 2:31 PM check runs once per weekday, late if triggers overran it."""
+
+    def _run(self, monkeypatch, now, end_check):
+        calls = []
+        monkeypatch.setattr(scheduler, 'check_end_of_window', lambda: calls.append(now))
+        return run_end_of_window_check_if_due(now, end_check), calls
+
+    def test_not_due_yet(self, monkeypatch):
+        deadline = _et(2, 14, 31)
+        assert self._run(monkeypatch, _et(2, 14, 10), deadline) == (deadline, [])
+
+    def test_runs_on_time(self, monkeypatch):
+        next_check, calls = self._run(monkeypatch, _et(2, 14, 31), _et(2, 14, 31))
+        assert len(calls) == 1
+        assert next_check == _et(3, 14, 31)
+
+    def test_overrun_triggers_caught_up(self, monkeypatch):
+        """Triggers that finish at 2:45 PM must not push today's check to tomorrow."""
+        next_check, calls = self._run(monkeypatch, _et(2, 14, 45), _et(2, 14, 31))
+        assert calls == [_et(2, 14, 45)]
+        assert next_check == _et(3, 14, 31)
+
+    def test_failed_check_still_advances(self, monkeypatch):
+        def boom():
+            raise RuntimeError("alerting down")
+
+        monkeypatch.setattr(scheduler, 'check_end_of_window', boom)
+        assert run_end_of_window_check_if_due(_et(2, 14, 31), _et(2, 14, 31)) == _et(3, 14, 31)
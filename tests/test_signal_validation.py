@@ -6,7 +6,11 @@ detection, and edge cases to verify signals are legitimate.
 Run: python -m pytest tests/test_signal_validation.py -v
 """
 import math
+import threading
+from datetime import datetime, timedelta
+import orjson
 import pytest
+import pytz
 from desks.overnight_condors.signal_engine import (
     calculate_composite_score,
     generate_signal,
@@ -470,6 +474,7 @@ class TestAlerting:
             _state['last_poke_time'] = None
             _state['consecutive_api_failures'] = 0
             _state['api_failure_source'] = None
+            _state['alerts_sent_date'] = None
             _state['alerts_sent_today'] = set()
 
     def test_record_signal_success(self):
@@ -499,6 +504,140 @@ class TestAlerting:
         assert _state['consecutive_api_failures'] == 1
         assert _state['api_failure_source'] == 'OpenAI'
 
+    def test_api_failure_alert_sent_once(self, monkeypatch):
+        """Repeated failures past the threshold should alert only once per day."""
+        import core.alerting as alerting
+        self._reset_state()
+        sent = []
+        monkeypatch.setattr(alerting, '_send_alert', lambda title, *a, **k: sent.append(title))
+        for _ in range(4):
+            record_api_failure('OpenAI')
+        assert sent == ['OpenAI API Down']
+        assert _state['consecutive_api_failures'] == 4
+
+    def test_alert_dedup_rolls_over_by_date(self):
+        """Yesterday's dedup keys should be dropped on the first claim of a new day."""
+        from core.alerting import _claim_alert
+        self._reset_state()
+        assert _claim_alert('no_signal_2026-03-02', '2026-03-02')
+        assert not _claim_alert('no_signal_2026-03-02', '2026-03-02')
+        assert _claim_alert('no_signal_2026-03-03', '2026-03-03')
+        assert _state['alerts_sent_today'] == {'no_signal_2026-03-03'}
+
+    def test_warnings_batched_into_one_post(self, monkeypatch):
+        """A burst of non-critical alerts should reach the webhook as one POST."""
+        import core.alerting as alerting
+        posts = []
+        delivered = threading.Event()
+
+        def fake_post(url, text, label):
+            posts.append(text)
+            delivered.set()
+            return True
+
+        monkeypatch.setattr(alerting, '_get_webhook_url', lambda: 'https://hooks.example/x')
+        monkeypatch.setattr(alerting, '_post_alert_text', fake_post)
+        assert alerting._send_alert("First", "a")
+        assert alerting._send_alert("Second", "b")
+        assert delivered.wait(timeout=5)
+        assert len(posts) == 1
+        assert "First" in posts[0] and "Second" in posts[0]
+
+    def test_queued_alert_keeps_url_resolved_at_enqueue(self, monkeypatch):
+        """A queued alert is still posted if the config read fails before the batch drains."""
+        import core.alerting as alerting
+        urls = iter(['https://hooks.example/x'])
+        posted = []
+        delivered = threading.Event()
+
+        def fake_post(url, text, label):
+            posted.append(url)
+            delivered.set()
+            return True
+
+        monkeypatch.setattr(alerting, '_get_webhook_url', lambda: next(urls, None))
+        monkeypatch.setattr(alerting, '_post_alert_text', fake_post)
+        assert alerting._send_alert("Queued", "a")
+        assert delivered.wait(timeout=5)
+        assert posted == ['https://hooks.example/x']
+
+    def test_exit_drain_posts_queued_alerts(self, monkeypatch):
+        """Alerts still inside the batch window are posted by the atexit drain."""
+        import core.alerting as alerting
+        posts = []
+        monkeypatch.setattr(alerting, 'ALERT_BATCH_WINDOW_SEC', 60)
+        monkeypatch.setattr(alerting, '_get_webhook_url', lambda: 'https://hooks.example/x')
+        monkeypatch.setattr(alerting, '_post_alert_text',
+                            lambda url, text, label: posts.append(text) or True)
+        assert alerting._send_alert("Pending", "a")
+        alerting._drain_alert_queue()
+        assert len(posts) == 1 and "Pending" in posts[0]
+        assert not alerting._alert_worker.is_alive()
+
+    def test_critical_alert_sent_immediately(self, monkeypatch):
+        """Critical alerts bypass the batch queue and report delivery status."""
+        import core.alerting as alerting
+        monkeypatch.setattr(alerting, '_get_webhook_url', lambda: 'https://hooks.example/x')
+        monkeypatch.setattr(alerting, '_post_alert_text', lambda url, text, label, desk_tag='': False)
+        assert not alerting._send_alert("Down", "x", level='critical')
+
+    def test_immediate_alert_logs_desk_tag_first(self, monkeypatch, capsys):
+        """Single alerts keep the '[ALERT] [desk_id]' log prefix."""
+        import core.alerting as alerting
+
+        class Resp:
+            status_code = 200
+
+        monkeypatch.setattr(alerting, '_get_webhook_url', lambda: 'https://hooks.example/x')
+        monkeypatch.setattr(alerting, 'post_json', lambda url, payload, timeout: Resp())
+        assert alerting._send_alert("Down", "x", level='critical', desk_id='desk_a')
+        assert "[ALERT] [desk_a] Sent: Down" in capsys.readouterr().out
+
+    def test_webhook_url_cached(self, monkeypatch):
+        """Config should be read once until reset_webhook_cache() is called."""
+        import core.alerting as alerting
+        import core.config
+        calls = []
+
+        def fake_config():
+            calls.append(1)
+            return {'ALERT_WEBHOOK_URL': ' https://hooks.example/x '}
+
+        monkeypatch.setattr(core.config, 'get_config', fake_config)
+        alerting.reset_webhook_cache()
+        try:
+            assert alerting._get_webhook_url() == 'https://hooks.example/x'
+            assert alerting._get_webhook_url() == 'https://hooks.example/x'
+            assert len(calls) == 1
+            alerting.reset_webhook_cache()
+            alerting._get_webhook_url()
+            assert len(calls) == 2
+        finally:
+            alerting.reset_webhook_cache()
+
+    def test_failed_config_read_not_cached(self, monkeypatch):
+        """A config error or missing URL must not stick; the next alert retries."""
+        import core.alerting as alerting
+        import core.config
+        replies = [RuntimeError("config unavailable"), {}, {'ALERT_WEBHOOK_URL': 'https://hooks.example/x'}]
+
+        def fake_config():
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        monkeypatch.setattr(core.config, 'get_config', fake_config)
+        alerting.reset_webhook_cache()
+        try:
+            assert alerting._get_webhook_url() is None
+            assert alerting._get_webhook_url() is None
+            assert alerting._get_webhook_url() == 'https://hooks.example/x'
+            assert alerting._get_webhook_url() == 'https://hooks.example/x'
+            assert replies == []
+        finally:
+            alerting.reset_webhook_cache()
+
     def test_reset_daily(self):
         """Daily reset should clear the alerts_sent_today set."""
         self._reset_state()
@@ -515,6 +654,94 @@ class TestAlerting:
         assert 'last_signal_date' in status
         assert 'consecutive_api_failures' in status
         assert status['consecutive_api_failures'] == 0
+        assert status['alerts_sent_today'] == 0
+
+
+# ── GPT Result Cache Tests ─────────────────────────────────────────────
+
+
+class TestGPTCache:
+    """Identical news at the same temperature should hit OpenAI once."""
+
+    @pytest.fixture
+    def openai(self, monkeypatch):
+        import desks.overnight_condors.signals.gpt_news as gpt_news
+        calls = []
+
+        class _Resp:
+            status_code = 200
+            content = orjson.dumps({
+                'usage': {'prompt_tokens': 100, 'completion_tokens': 20, 'total_tokens': 120},
+                'choices': [{'message': {'content': '{"overnight_magnitude_risk_score": 4}'}}],
+            })
+
+        def fake_post(url, **kwargs):
+            calls.append(kwargs['json']['temperature'])
+            return _Resp()
+
+        monkeypatch.setattr(gpt_news, 'get_config', lambda: {'OPENAI_API_KEY': 'test'})
+        monkeypatch.setattr(gpt_news.SESSION, 'post', fake_post)
+        gpt_news._GPT_CACHE.clear()
+        yield calls
+        gpt_news._GPT_CACHE.clear()
+
+    NOW = pytz.timezone('US/Eastern').localize(datetime(2026, 3, 2, 13, 30))
+
+    def test_repeat_call_served_from_cache(self, openai):
+        from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
+        news = {'count': 3, 'summary': 'Fed holds rates steady'}
+        first = analyze_gpt_news(news, now=self.NOW)
+        second = analyze_gpt_news(news, now=self.NOW)
+        assert openai == [0.1]
+        assert second['score'] == first['score']
+        assert second['token_usage']['cost'] == 0.0
+
+    def test_confirmation_temperature_not_shared(self, openai):
+        from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
+        news = {'count': 3, 'summary': 'Fed holds rates steady'}
+        analyze_gpt_news(news, temperature=0.1, now=self.NOW)
+        analyze_gpt_news(news, temperature=0.4, now=self.NOW)
+        assert openai == [0.1, 0.4]
+
+    def test_different_current_time_not_shared(self, openai):
+        """The prompt's CURRENT TIME line is part of the key."""
+        from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
+        news = {'count': 3, 'summary': 'Fed holds rates steady'}
+        analyze_gpt_news(news, now=self.NOW)
+        analyze_gpt_news(news, now=self.NOW + timedelta(minutes=20))
+        assert openai == [0.1, 0.1]
+
+    def test_cached_result_is_a_copy(self, openai):
+        from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
+        news = {'count': 3, 'summary': 'Fed holds rates steady'}
+        first = analyze_gpt_news(news, now=self.NOW)
+        first['score'] = 10
+        assert analyze_gpt_news(news, now=self.NOW)['score'] != 10
+
+    def test_malformed_reply_defaults_to_elevated(self, openai, monkeypatch):
+        import desks.overnight_condors.signals.gpt_news as gpt_news
+
+        class _BadResp:
+            status_code = 200
+            content = orjson.dumps({'choices': [{'message': {'content': 'not json'}}]})
+
+        monkeypatch.setattr(gpt_news.SESSION, 'post', lambda url, **kwargs: _BadResp())
+        result = gpt_news.analyze_gpt_news({'count': 3, 'summary': 'Fed holds rates steady'})
+        assert result['score'] == 7
+        assert result['category'] == 'ELEVATED'
+        assert not gpt_news._GPT_CACHE
+
+    def test_precomputed_result_skips_openai(self, openai, monkeypatch):
+        import desks.overnight_condors.signal_engine as signal_engine
+        from desks.overnight_condors.signals.gpt_news import analyze_gpt_news
+        monkeypatch.setattr(signal_engine, 'check_mag7_earnings',
+                            lambda: {'risk_modifier': 0, 'message': ''})
+        gpt = analyze_gpt_news({'count': 3, 'summary': 'Fed holds rates steady'}, temperature=0.4)
+        result = signal_engine.run_signal_analysis(
+            _make_spx_data(5800, 5820, 5780, [5800 + 5 * (i % 2) for i in range(25)]),
+            _make_vix1d_data(12.0), None, gpt=gpt)
+        assert openai == [0.4]
+        assert result['indicators']['gpt'] is gpt
 
 
 # ── Backtest Module Tests ──────────────────────────────────────────────